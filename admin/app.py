@@ -1,13 +1,48 @@
 """Main application class that orchestrates all Matrix administration functionality."""
 
+import atexit
 import sys
+from collections.abc import Callable
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from .core import ConfigManager, MatrixClient
-from .rooms import RoomManager
-from .stats import StatsManager
-from .tokens import TokenManager
 from .ui import ScreenManager
-from .users import UserManager
+
+if TYPE_CHECKING:
+    from .rooms import RoomManager
+    from .stats import StatsManager
+    from .tokens import TokenManager
+    from .users import UserManager
+
+
+# Main menu listing below the header; static, so built once at import.
+_MENU_BODY = (
+    "Room Management:\n"
+    "  1. List all rooms\n"
+    "  2. Delete room\n"
+    "  3. Fix room permissions (Element Call)\n"
+    "  4. Force join user to room\n"
+    "\n"
+    "User Management:\n"
+    "  5. List all users\n"
+    "  6. Create new user\n"
+    "  7. Deactivate user\n"
+    "  8. Reset user password\n"
+    "\n"
+    "Registration Tokens:\n"
+    "  9. Create registration tokens (batch)\n"
+    " 10. List registration tokens\n"
+    " 11. Export existing tokens to file\n"
+    " 12. Delete registration token\n"
+    "\n"
+    "Server Information:\n"
+    " 13. Show server statistics\n"
+    " 14. Test connection\n"
+    " 15. Server information\n"
+    "\n"
+    "  0. Exit\n"
+)
 
 
 class MatrixAdminApp:
@@ -22,47 +57,65 @@ class MatrixAdminApp:
             base_url=self.config.get("homeserver_url", ""),
             admin_token=self.config.get("admin_token", ""),
         )
-
-        # Initialize managers
-        self.room_manager = RoomManager(self.client, self.screen_manager)
-        self.user_manager = UserManager(self.client, self.screen_manager)
-        self.stats_manager = StatsManager(self.client, self.screen_manager)
-        self.token_manager = TokenManager(
-            self.client, self.screen_manager
-        )  # Add this line
+        # Close pooled keep-alive connections however the program exits
+        atexit.register(self.client.close)
+
+        # Handler for each main menu option ("0" exits and is handled apart).
+        # Each looks its manager up when called, so managers are still
+        # created on first use.
+        self.menu_actions: dict[str, Callable[[], None]] = {
+            "1": lambda: self.room_manager.list_rooms(),
+            "2": lambda: self.room_manager.delete_room(),
+            "3": lambda: self.room_manager.fix_room_permissions(),
+            "4": lambda: self.room_manager.force_join_user(),
+            "5": lambda: self.user_manager.list_users(),
+            "6": lambda: self.user_manager.create_user(),
+            "7": lambda: self.user_manager.deactivate_user(),
+            "8": lambda: self.user_manager.reset_password(),
+            "9": lambda: self.token_manager.create_registration_token(),
+            "10": lambda: self.token_manager.list_registration_tokens(),
+            "11": lambda: self.token_manager.export_existing_tokens(),
+            "12": lambda: self.token_manager.delete_registration_token(),
+            "13": lambda: self.stats_manager.show_server_stats(),
+            "14": lambda: self.stats_manager.test_connection_interactive(),
+            "15": lambda: self.stats_manager.show_server_info(),
+        }
 
         # Setup configuration if needed
         if not self.client.base_url or not self.client.admin_token:
             if not ConfigManager.setup_config_interactive(self.client):
                 sys.exit(1)
 
+    # Managers are imported and built lazily, so startup and the first menu
+    # do not wait for modules the session may never use.
+    @cached_property
+    def room_manager(self) -> "RoomManager":
+        from .rooms import RoomManager
+
+        return RoomManager(self.client, self.screen_manager)
+
+    @cached_property
+    def user_manager(self) -> "UserManager":
+        from .users import UserManager
+
+        return UserManager(self.client, self.screen_manager)
+
+    @cached_property
+    def stats_manager(self) -> "StatsManager":
+        from .stats import StatsManager
+
+        return StatsManager(self.client, self.screen_manager)
+
+    @cached_property
+    def token_manager(self) -> "TokenManager":
+        from .tokens import TokenManager
+
+        return TokenManager(self.client, self.screen_manager)
+
     def show_menu(self) -> None:
         """Display the main menu."""
-        self.screen_manager.show_header("Matrix Server Administration")
-        print("Room Management:")
-        print("  1. List all rooms")
-        print("  2. Delete room")
-        print("  3. Fix room permissions (Element Call)")
-        print("  4. Force join user to room")
-        print()
-        print("User Management:")
-        print("  5. List all users")
-        print("  6. Create new user")
-        print("  7. Deactivate user")
-        print("  8. Reset user password")
-        print()
-        print("Registration Tokens:")
-        print("  9. Create registration tokens (batch)")
-        print(" 10. List registration tokens")
-        print(" 11. Export existing tokens to file")
-        print(" 12. Delete registration token")
-        print()
-        print("Server Information:")
-        print(" 13. Show server statistics")
-        print(" 14. Test connection")
-        print(" 15. Server information")
-        print()
-        print("  0. Exit")
+        with self.screen_manager.frame("Matrix Server Administration") as out:
+            out.write(_MENU_BODY)
 
     def handle_menu_choice(self, choice: str) -> bool:
         """Handle menu choice. Returns False if should exit."""
@@ -71,36 +124,9 @@ class MatrixAdminApp:
                 self.screen_manager.clear_screen()
                 print("Goodbye!")
                 return False
-            if choice == "1":
-                self.room_manager.list_rooms()
-            elif choice == "2":
-                self.room_manager.delete_room()
-            elif choice == "3":
-                self.room_manager.fix_room_permissions()
-            elif choice == "4":
-                self.room_manager.force_join_user()
-            elif choice == "5":
-                self.user_manager.list_users()
-            elif choice == "6":
-                self.user_manager.create_user()
-            elif choice == "7":
-                self.user_manager.deactivate_user()
-            elif choice == "8":
-                self.user_manager.reset_password()
-            elif choice == "9":
-                self.token_manager.create_registration_token()
-            elif choice == "10":
-                self.token_manager.list_registration_tokens()
-            elif choice == "11":
-                self.token_manager.export_existing_tokens()
-            elif choice == "12":
-                self.token_manager.delete_registration_token()
-            elif choice == "13":
-                self.stats_manager.show_server_stats()
-            elif choice == "14":
-                self.stats_manager.test_connection_interactive()
-            elif choice == "15":
-                self.stats_manager.show_server_info()
+            action = self.menu_actions.get(choice)
+            if action is not None:
+                action()
             else:
                 self.screen_manager.show_header("Invalid Option")
                 print("Invalid option. Please try again.")
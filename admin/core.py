@@ -2,17 +2,57 @@
 
 from __future__ import annotations
 
+import base64
 import getpass
+import http.client
 import json
 import os
-import urllib.error
+import re
+import threading
+import time
 import urllib.parse
 import urllib.request
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+
+# One KEY=value line of a .env file. Blank lines and "#" comments never match;
+# whitespace around the key, the "=" and the value is ignored.
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)\s*$",
+    re.MULTILINE,
+)
+
+# Request bodies are sent as compact UTF-8 JSON. Reusing one encoder skips
+# json.dumps building a new one for non-default options on every call.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# Methods safe to send again when a reused keep-alive connection turns out to
+# be dead: the server may already have acted on the first attempt.
+_RETRYABLE_METHODS = frozenset({"GET", "PUT"})
+
+
+class MatrixAPIError(Exception):
+    """Error response from the homeserver, with its HTTP status."""
+
+    def __init__(self, status: int, error: str) -> None:
+        super().__init__(f"HTTP {status}: {error}")
+        self.status = status
 
 
 class MatrixClient:
     """Core Matrix API client for server communication."""
 
+    # Keep-alive connections kept open between requests.
+    MAX_IDLE_CONNECTIONS = 8
+    REQUEST_TIMEOUT = 30
+    # Items requested per page from paginated admin list endpoints.
+    PAGE_SIZE = 500
+    # Requests kept in flight at once by the bulk helpers.
+    MAX_CONCURRENT_REQUESTS = MAX_IDLE_CONNECTIONS
+    # Seconds a successful whoami check is trusted before asking again.
+    WHOAMI_CACHE_TTL = 300
+
     def __init__(
         self,
         base_url: str | None = None,
@@ -20,6 +60,192 @@ class MatrixClient:
     ) -> None:
         self.base_url = base_url.rstrip("/") if base_url else ""
         self.admin_token = admin_token or ""
+        self._idle_connections: list[http.client.HTTPConnection] = []
+        self._pool_lock = threading.Lock()
+        self._pool_origin: tuple[str, str] | None = None
+        self._alias_cache: dict[str, str] = {}
+        self._headers: tuple[str, dict[str, bytes]] | None = None
+        self._base_url_split: tuple[str, tuple[str, str, str]] | None = None
+        # (base_url, proxy host, port and headers or None) as found by _proxy
+        self._proxy_cache: (
+            tuple[str, tuple[str, int, dict[str, str]] | None] | None
+        ) = None
+        # (checked at, base_url, admin_token, user_id) of the last good whoami
+        self._whoami_cache: tuple[float, str, str, str] | None = None
+
+    def _base_url_parts(self) -> tuple[str, str, str]:
+        """Scheme, host and path prefix of ``base_url``, split once per URL."""
+        if self._base_url_split is None or self._base_url_split[0] != self.base_url:
+            parts = urllib.parse.urlsplit(self.base_url)
+            self._base_url_split = (
+                self.base_url,
+                (parts.scheme, parts.netloc, parts.path.rstrip("/")),
+            )
+        return self._base_url_split[1]
+
+    def _proxy(self) -> tuple[str, int, dict[str, str]] | None:
+        """Proxy host, port and headers for ``base_url``, looked up once per URL.
+
+        Follows HTTP_PROXY/HTTPS_PROXY and NO_PROXY (or the platform's proxy
+        settings) the way urllib does. None means connecting directly.
+        """
+        if self._proxy_cache is None or self._proxy_cache[0] != self.base_url:
+            scheme, netloc, _ = self._base_url_parts()
+            proxy_url = urllib.request.getproxies().get(scheme)
+            host = urllib.parse.urlsplit(f"//{netloc}").hostname or ""
+            proxy = None
+            if proxy_url and not urllib.request.proxy_bypass(host):
+                if "://" not in proxy_url:
+                    proxy_url = f"http://{proxy_url}"
+                parts = urllib.parse.urlsplit(proxy_url)
+                headers: dict[str, str] = {}
+                if parts.username is not None:
+                    credentials = ":".join(
+                        urllib.parse.unquote(value or "")
+                        for value in (parts.username, parts.password)
+                    )
+                    token = base64.b64encode(credentials.encode("utf-8")).decode()
+                    headers["Proxy-Authorization"] = f"Basic {token}"
+                proxy = (parts.hostname or "", parts.port or 80, headers)
+            self._proxy_cache = (self.base_url, proxy)
+        return self._proxy_cache[1]
+
+    def _acquire_connection(
+        self,
+        reuse: bool = True,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """Take an idle connection to the homeserver or open a new one.
+
+        Without ``reuse`` a new connection is always opened. Returns the
+        connection and whether it was reused from the pool.
+        """
+        origin = self._base_url_parts()[:2]
+
+        with self._pool_lock:
+            if origin != self._pool_origin:
+                # base_url changed (e.g. during interactive setup)
+                self._close_idle_connections()
+                self._pool_origin = origin
+            if reuse and self._idle_connections:
+                return self._idle_connections.pop(), True
+
+        scheme, netloc = origin
+        if scheme == "https":
+            connection_class = http.client.HTTPSConnection
+        elif scheme == "http":
+            connection_class = http.client.HTTPConnection
+        else:
+            msg = f"Unsupported homeserver URL: {self.base_url!r}"
+            raise ValueError(msg)
+
+        proxy = self._proxy()
+        if proxy is None:
+            return connection_class(netloc, timeout=self.REQUEST_TIMEOUT), False
+        proxy_host, proxy_port, proxy_headers = proxy
+        connection = connection_class(
+            proxy_host,
+            proxy_port,
+            timeout=self.REQUEST_TIMEOUT,
+        )
+        if scheme == "https":
+            # CONNECT through the proxy; TLS then runs end to end
+            connection.set_tunnel(netloc, headers=proxy_headers)
+        return connection, False
+
+    def _release_connection(self, connection: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, or close it if the pool is full."""
+        with self._pool_lock:
+            if len(self._idle_connections) < self.MAX_IDLE_CONNECTIONS:
+                self._idle_connections.append(connection)
+                return
+        connection.close()
+
+    def _close_idle_connections(self) -> None:
+        """Close pooled connections. Caller must hold the pool lock."""
+        for connection in self._idle_connections:
+            connection.close()
+        self._idle_connections.clear()
+
+    def close(self) -> None:
+        """Close all idle keep-alive connections."""
+        with self._pool_lock:
+            self._close_idle_connections()
+
+    def _exchange(
+        self,
+        connection: http.client.HTTPConnection,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, bytes],
+    ) -> tuple[int, bytes]:
+        """Run one request/response on ``connection`` and pool it afterwards."""
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            payload = response.read()
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release_connection(connection)
+        return response.status, payload
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        body: bytes | None,
+        headers: dict[str, bytes],
+    ) -> tuple[int, bytes]:
+        """Send a request over a pooled connection and return status and body.
+
+        Requests that must not run twice (POST, DELETE) always go over a new
+        connection, so a stale keep-alive connection never forces a resend.
+        """
+        scheme, netloc, path_prefix = self._base_url_parts()
+        path = path_prefix + endpoint
+        proxy = self._proxy()
+        if proxy is not None and scheme == "http":
+            # Plain HTTP goes to the proxy with the absolute URL
+            path = f"http://{netloc}{path}"
+            headers = dict(headers)
+            for name, value in proxy[2].items():
+                headers[name] = value.encode("latin-1")
+        retryable = method in _RETRYABLE_METHODS
+
+        connection, reused = self._acquire_connection(reuse=retryable)
+        try:
+            return self._exchange(connection, method, path, body, headers)
+        except (ConnectionError, http.client.BadStatusLine):
+            if not reused:
+                raise
+            # The server dropped an idle keep-alive connection; the others in
+            # the pool are likely stale too. Retry once on a fresh one.
+            with self._pool_lock:
+                self._close_idle_connections()
+
+        connection, _ = self._acquire_connection()
+        return self._exchange(connection, method, path, body, headers)
+
+    def _request_headers(self) -> dict[str, bytes]:
+        """Headers sent with every request, rebuilt only when the token changes.
+
+        Values are pre-encoded as http.client would encode them (Latin-1), so
+        it sends them as-is. The dict is shared and must not be mutated.
+        """
+        if self._headers is None or self._headers[0] != self.admin_token:
+            headers = {
+                "Authorization": f"Bearer {self.admin_token}".encode("latin-1"),
+                "Content-Type": b"application/json",
+                "User-Agent": b"MatrixAdminTool",
+                "Connection": b"keep-alive",
+            }
+            self._headers = (self.admin_token, headers)
+        return self._headers[1]
 
     def make_request(
         self,
@@ -28,46 +254,156 @@ class MatrixClient:
         data: dict | None = None,
     ) -> dict | None:
         """Make HTTP request to Matrix server."""
-        url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self.admin_token}",
-            "Content-Type": "application/json",
-            "User-Agent": "MatrixAdminTool",
-        }
-
         try:
-            if data:
-                data_bytes = json.dumps(data).encode("utf-8")
-                request = urllib.request.Request(
-                    url,
-                    data=data_bytes,
-                    headers=headers,
-                    method=method,
-                )
-            else:
-                request = urllib.request.Request(url, headers=headers, method=method)
-
-            with urllib.request.urlopen(request) as response:
-                return json.loads(response.read().decode("utf-8"))
-
-        except urllib.error.HTTPError as e:
-            error_msg = e.read().decode("utf-8")
-            try:
-                error_json = json.loads(error_msg)
-                msg = f"HTTP {e.code}: {error_json.get('error', error_msg)}"
-                raise Exception(msg)
-            except json.JSONDecodeError:
-                msg = f"HTTP {e.code}: {error_msg}"
-                raise Exception(msg)
+            headers = self._request_headers()
+            data_bytes = _JSON_ENCODER.encode(data).encode("utf-8") if data else None
+            status, payload = self._send(method, endpoint, data_bytes, headers)
+            if status < 300:
+                # json.loads detects the UTF encoding of bytes itself, which
+                # saves a full decode pass over large list responses.
+                return json.loads(payload)
         except Exception as e:
             msg = f"Request failed: {e}"
             raise Exception(msg)
 
-    def test_connection(self) -> bool:
-        """Test the Matrix server connection and admin token."""
+        if status < 400:
+            # Redirects are not followed; usually the URL needs https or a
+            # different host.
+            msg = f"Unexpected redirect; check the homeserver URL ({self.base_url})"
+            raise MatrixAPIError(status, msg)
+
+        # Synapse errors are JSON objects; bodies that are not (e.g. an HTML
+        # page from the reverse proxy) are reported as text without parsing.
+        error = None
+        if payload.lstrip()[:1] == b"{":
+            try:
+                error = json.loads(payload).get("error")
+            except ValueError:
+                pass
+        if not isinstance(error, str):
+            error = payload.decode("utf-8", errors="replace")
+        raise MatrixAPIError(status, error)
+
+    def request_many(
+        self,
+        requests: Iterable[tuple[str, str, dict | None]],
+    ) -> list[dict | None | Exception]:
+        """Run ``(method, endpoint, data)`` requests concurrently.
+
+        Results come back in request order; a failed request yields its
+        exception instead of raising, so one error does not abort the batch.
+        Each worker uses its own pooled keep-alive connection.
+        """
+        requests = list(requests)
+        if not requests:
+            return []
+
+        def run(request: tuple[str, str, dict | None]) -> dict | None | Exception:
+            try:
+                return self.make_request(*request)
+            except Exception as e:
+                return e
+
+        workers = min(self.MAX_CONCURRENT_REQUESTS, len(requests))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, requests))
+
+    def paginate(
+        self,
+        endpoint: str,
+        items_key: str,
+        limit: int | None = None,
+        total_key: str | None = None,
+    ) -> Iterator[dict]:
+        """Yield items from a paginated Synapse admin list endpoint.
+
+        Requests ``limit`` items at a time and follows ``next_batch`` (rooms)
+        or ``next_token`` (users) until the server reports no further pages,
+        so only a few pages of the response are parsed and held at a time.
+
+        If ``total_key`` names the item count in the response and the server
+        returns numeric offsets (the users endpoint sends them as digit
+        strings), the pages known to remain are requested up to
+        ``MAX_CONCURRENT_REQUESTS`` at a time. They are spaced by the page size
+        the server actually returned, which may be below ``limit``, and a page
+        is only used if the one before it ends at its offset; otherwise paging
+        continues from where that page ended. Items keep the server's order.
+        """
+        separator = "&" if "?" in endpoint else "?"
+        limit = limit or self.PAGE_SIZE
+
+        def page_request(offset: int | str) -> tuple[str, str, None]:
+            return (
+                "GET",
+                f"{endpoint}{separator}from={urllib.parse.quote(str(offset))}"
+                f"&limit={limit}",
+                None,
+            )
+
+        offsets: list[int | str] = [0]
+        while True:
+            if len(offsets) == 1:
+                responses = [self.make_request(*page_request(offsets[0]))]
+            else:
+                responses = self.request_many(map(page_request, offsets))
+
+            for i, response in enumerate(responses):
+                if isinstance(response, Exception):
+                    raise response
+                if not response:
+                    return
+                yield from response.get(items_key, [])
+
+                next_from = response.get("next_batch", response.get("next_token"))
+                if next_from is None:
+                    return
+                if isinstance(next_from, str) and next_from.isdigit():
+                    next_from = int(next_from)
+                if i + 1 == len(offsets) or next_from != offsets[i + 1]:
+                    # Last page of the batch, or the server paged differently
+                    # than planned: later pages of the batch are dropped.
+                    break
+
+            # Continue after the last page that lines up
+            offset = offsets[i]
+            total = response.get(total_key) if total_key else None
+            offsets = []
+            if (
+                isinstance(next_from, int)
+                and isinstance(offset, int)
+                and next_from > offset
+                and isinstance(total, int)
+            ):
+                pages = range(next_from, total, next_from - offset)
+                offsets = list(pages[: self.MAX_CONCURRENT_REQUESTS])
+            if not offsets:
+                offsets = [next_from]
+
+    def test_connection(self, force: bool = False) -> bool:
+        """Test the Matrix server connection and admin token.
+
+        A success is remembered for ``WHOAMI_CACHE_TTL`` seconds for the same
+        server and token; ``force`` always asks the server.
+        """
+        cached = self._whoami_cache
+        if (
+            not force
+            and cached is not None
+            and cached[1:3] == (self.base_url, self.admin_token)
+            and time.monotonic() - cached[0] < self.WHOAMI_CACHE_TTL
+        ):
+            print(f"Connected as: {cached[3]}")
+            return True
+
         try:
             response = self.make_request("GET", "/_matrix/client/r0/account/whoami")
             if response and "user_id" in response:
+                self._whoami_cache = (
+                    time.monotonic(),
+                    self.base_url,
+                    self.admin_token,
+                    response["user_id"],
+                )
                 print(f"Connected as: {response['user_id']}")
                 return True
         except Exception as e:
@@ -75,17 +411,65 @@ class MatrixClient:
         return False
 
     def get_room_id_from_alias(self, room_alias: str) -> str | None:
-        """Convert room alias to room ID."""
+        """Convert room alias to room ID. Successful lookups are cached."""
+        room_id = self._alias_cache.get(room_alias)
+        if room_id is not None:
+            return room_id
+
         try:
-            encoded_alias = urllib.parse.quote(room_alias, safe="")
-            response = self.make_request(
-                "GET",
-                f"/_matrix/client/r0/directory/room/{encoded_alias}",
-            )
-            return response.get("room_id") if response else None
+            response = self.make_request("GET", self._alias_endpoint(room_alias))
+            room_id = response.get("room_id") if response else None
         except Exception:
             return None
 
+        if room_id:
+            self._alias_cache[room_alias] = room_id
+        return room_id
+
+    def resolve_many(self, identifiers: Iterable[str]) -> dict[str, str]:
+        """Map room aliases and IDs to room IDs, looking aliases up concurrently.
+
+        Room IDs map to themselves and cached aliases need no request. Aliases
+        that cannot be resolved are left out of the result.
+        """
+        resolved: dict[str, str] = {}
+        pending: list[str] = []
+        for identifier in dict.fromkeys(identifiers):
+            if not identifier.startswith("#"):
+                resolved[identifier] = identifier
+            elif identifier in self._alias_cache:
+                resolved[identifier] = self._alias_cache[identifier]
+            else:
+                pending.append(identifier)
+
+        responses = self.request_many(
+            ("GET", self._alias_endpoint(alias), None) for alias in pending
+        )
+        for alias, response in zip(pending, responses):
+            room_id = response.get("room_id") if isinstance(response, dict) else None
+            if room_id:
+                self._alias_cache[alias] = room_id
+                resolved[alias] = room_id
+        return resolved
+
+    @staticmethod
+    def _alias_endpoint(room_alias: str) -> str:
+        """Client-server directory endpoint that resolves ``room_alias``."""
+        encoded_alias = urllib.parse.quote(room_alias, safe="")
+        return f"/_matrix/client/r0/directory/room/{encoded_alias}"
+
+    def remember_room_aliases(self, aliases: Iterable[tuple[str, str]]) -> None:
+        """Cache known ``(alias, room_id)`` pairs, e.g. from a fetched room list."""
+        self._alias_cache.update(aliases)
+
+    def forget_room_aliases(self, room_id: str) -> None:
+        """Drop cached alias lookups pointing at ``room_id`` (e.g. after deletion)."""
+        stale = [
+            alias for alias, cached in self._alias_cache.items() if cached == room_id
+        ]
+        for alias in stale:
+            del self._alias_cache[alias]
+
     def resolve_room_identifier(self, identifier: str) -> tuple[str, str]:
         """Resolve room alias or ID to room ID and display name."""
         if identifier.startswith("#"):
@@ -100,19 +484,22 @@ class MatrixClient:
 class ConfigManager:
     """Manage application configuration and setup."""
 
+    @staticmethod
+    def read_env_file(path: str = ".env") -> dict[str, str]:
+        """Parse ``path`` into lowercased keys; a missing file gives no values."""
+        try:
+            with open(path) as f:
+                text = f.read()
+        except OSError:
+            return {}
+
+        return {key.lower(): value for key, value in _ENV_LINE_RE.findall(text)}
+
     @staticmethod
     def load_config() -> dict[str, str]:
         """Load configuration from .env file or environment variables."""
-        config = {}
-
         # Try loading from .env file
-        if os.path.exists(".env"):
-            with open(".env") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        config[key.lower()] = value
+        config = ConfigManager.read_env_file()
 
         # Override with environment variables
         config["homeserver_url"] = os.getenv(
@@ -1,116 +1,386 @@
 """Room management functionality for Matrix administration."""
 
+from __future__ import annotations
+
+import heapq
+import random
 import time
 import urllib.parse
-from .core import MatrixClient
+from collections.abc import Callable, Iterator, Sequence
+from functools import cached_property
+
+from .core import MatrixAPIError, MatrixClient
 from .ui import FilterSortUI, ScreenManager, TerminalPaginator
+from .users import UserIndex
 from .utils import DataFormatter, ProgressMonitor, SelectionParser
 
 
+# Filtered subsets holding at least 1/N of all rooms are ordered by masking the
+# cached full ordering rather than sorting them again.
+_ORDER_REUSE_FRACTION = 4
+# Smaller subsets are only partially ordered (heapq) while the pages asked for
+# reach no further than 1/N of them.
+_PARTIAL_SORT_FRACTION = 8
+
+# Power level required for each Element Call event type once permissions are
+# fixed: any member may start or join calls.
+_ELEMENT_CALL_EVENT_POWERS = {
+    "org.matrix.msc3401.call.member": 0,
+    "org.matrix.msc3401.call": 0,
+    "m.call.member": 0,
+    "m.call": 0,
+}
+
+# Sort option for each choice of the sort menu.
+_SORT_OPTIONS = {
+    "0": "none",
+    "1": "name_asc",
+    "2": "name_desc",
+    "3": "alias_asc",
+    "4": "alias_desc",
+    "5": "members_asc",
+    "6": "members_desc",
+    "7": "id_asc",
+    "8": "id_desc",
+}
+
+# RoomIndex column searched by each substring filter type.
+_TEXT_FILTER_COLUMNS = {
+    "name": "names",
+    "alias": "aliases",
+    "id": "ids",
+    "any": "combined",
+}
+
+
+def _backoff_delays(initial: float, maximum: float) -> Iterator[float]:
+    """Yield poll delays growing 1.8x per step up to ``maximum``, with jitter."""
+    delay = initial
+    while True:
+        yield delay + random.uniform(0, delay * 0.1)
+        delay = min(delay * 1.8, maximum)
+
+
+def _compile_member_predicate(filter_text: str) -> Callable[[int], bool]:
+    """Parse a member-count filter once into a predicate over member counts.
+
+    Supports "5" / "=5" (exact), ">20", "<5" and ranges like "10-50", "10-" or
+    "-50". Raises ValueError for anything else.
+    """
+    filter_text = filter_text.strip()
+    if "-" in filter_text:
+        low_text, high_text = (part.strip() for part in filter_text.split("-", 1))
+        low = int(low_text) if low_text else 0
+        high = int(high_text) if high_text else float("inf")
+        return lambda count: low <= count <= high
+    if filter_text.startswith(">"):
+        threshold = int(filter_text[1:])
+        return lambda count: count > threshold
+    if filter_text.startswith("<"):
+        threshold = int(filter_text[1:])
+        return lambda count: count < threshold
+    threshold = int(filter_text.removeprefix("="))
+    return lambda count: count == threshold
+
+
+class RoomIndex:
+    """Lowercased column views over a fetched room list.
+
+    Built once per fetch so that filtering and sorting work on plain lists of
+    strings and ints instead of calling ``dict.get(...).lower()`` per room on
+    every redraw. Results are positions into ``rooms``.
+    """
+
+    def __init__(self, rooms: list[dict]) -> None:
+        self.rooms = rooms
+        self.names = [(room.get("name") or "").lower() for room in rooms]
+        self.aliases = [(room.get("canonical_alias") or "").lower() for room in rooms]
+        self.ids = [(room.get("room_id") or "").lower() for room in rooms]
+        self.members = [room.get("joined_members", 0) for room in rooms]
+        self.sort_columns = {
+            "name": self.names,
+            "alias": self.aliases,
+            "members": self.members,
+            "id": self.ids,
+        }
+        self._orders: dict[tuple[str, bool], list[int]] = {}
+        self._entries: dict[int, str] = {}
+        self._last_searches: dict[str, tuple[str, list[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rooms)
+
+    def format_entry(self, room: dict, number: int) -> str:
+        """Display entry for one of the indexed rooms, numbered ``number``.
+
+        The entry text is formatted once per room and reused on later frames;
+        only the number prefix changes with the position in the list.
+        """
+        entry = self._entries.get(id(room))
+        if entry is None:
+            entry = self._entries[id(room)] = DataFormatter.format_room_entry(room)
+        return f"{number:3d}. {entry}"
+
+    @cached_property
+    def combined(self) -> list[str]:
+        """Name, alias and ID per room joined by NUL, for "any field" filters.
+
+        The separator cannot appear in typed filter text, so a match never
+        spans two fields.
+        """
+        return [
+            f"{name}\0{alias}\0{room_id}"
+            for name, alias, room_id in zip(self.names, self.aliases, self.ids)
+        ]
+
+    def search(self, column_name: str, needle: str) -> list[int]:
+        """Positions of rooms whose ``column_name`` values contain ``needle``.
+
+        The last result per column is kept: an unchanged filter is not
+        rescanned, and a filter containing the previous one (e.g. one more
+        character typed) only rescans the rooms that matched before. The
+        returned list is shared and must not be mutated.
+        """
+        column = getattr(self, column_name)
+        last = self._last_searches.get(column_name)
+        if last is not None:
+            last_needle, last_indices = last
+            if last_needle == needle:
+                return last_indices
+            if last_needle in needle:
+                # Anything containing the longer needle contained the shorter
+                indices = [i for i in last_indices if needle in column[i]]
+                self._last_searches[column_name] = (needle, indices)
+                return indices
+
+        indices = [i for i, value in enumerate(column) if needle in value]
+        self._last_searches[column_name] = (needle, indices)
+        return indices
+
+    def order(self, field: str, reverse: bool = False) -> list[int]:
+        """Positions of all rooms sorted by ``field``, computed once per index.
+
+        The returned list is shared between callers and must not be mutated.
+        """
+        key = (field, reverse)
+        order = self._orders.get(key)
+        if order is None:
+            column = self.sort_columns[field]
+            order = self._orders[key] = sorted(
+                range(len(column)),
+                key=column.__getitem__,
+                reverse=reverse,
+            )
+        return order
+
+
+class RoomView(Sequence):
+    """Filtered rooms of an index, ordered lazily as pages are requested.
+
+    Only the rooms on the pages being shown are looked up; when ``column`` is
+    given, the leading pages are produced by a partial ``heapq`` selection
+    and the full sort is done only once a page deep enough is requested.
+    """
+
+    def __init__(
+        self,
+        index: RoomIndex,
+        positions: Sequence[int],
+        column: list | None = None,
+        reverse: bool = False,
+    ) -> None:
+        self.index = index
+        self.column = column
+        self.reverse = reverse
+        self._positions = positions
+        self._ordered = column is None
+        self._prefix: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def _ordered_positions(self, stop: int) -> Sequence[int]:
+        """Return ordered positions, valid at least up to ``stop``."""
+        if self._ordered or stop <= len(self._prefix):
+            return self._positions if self._ordered else self._prefix
+
+        if stop * _PARTIAL_SORT_FRACTION <= len(self._positions):
+            select = heapq.nlargest if self.reverse else heapq.nsmallest
+            self._prefix = select(stop, self._positions, key=self.column.__getitem__)
+            return self._prefix
+
+        self._positions = sorted(
+            self._positions,
+            key=self.column.__getitem__,
+            reverse=self.reverse,
+        )
+        self._ordered = True
+        return self._positions
+
+    def __getitem__(self, item):
+        rooms = self.index.rooms
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            positions = self._ordered_positions(stop)
+            return [rooms[i] for i in positions[start:stop:step]]
+
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            msg = "room view index out of range"
+            raise IndexError(msg)
+        return rooms[self._ordered_positions(item + 1)[item]]
+
+    def __iter__(self) -> Iterator[dict]:
+        rooms = self.index.rooms
+        return (rooms[i] for i in self._ordered_positions(len(self)))
+
+
 class RoomManager:
     """Manage Matrix rooms through the admin API."""
 
+    # Seconds a fetched room list is reused before asking the server again.
+    ROOMS_CACHE_TTL = 30
+    # Deletion status polling: first delay, delay cap (seconds) and attempts.
+    DELETE_POLL_INITIAL_DELAY = 0.25
+    DELETE_POLL_MAX_DELAY = 8.0
+    DELETE_POLL_ATTEMPTS = 15
+
     def __init__(self, client: MatrixClient, screen_manager: ScreenManager) -> None:
         self.client = client
         self.screen_manager = screen_manager
+        self._rooms_cache: tuple[float, list[dict]] | None = None
+        self._room_index: RoomIndex | None = None
+
+    def iter_rooms(self) -> Iterator[dict]:
+        """Stream rooms from the admin API, fetching later pages concurrently."""
+        return self.client.paginate(
+            "/_synapse/admin/v1/rooms",
+            "rooms",
+            total_key="total_rooms",
+        )
 
-    def filter_rooms_by_criteria(
-        self,
-        rooms: list[dict],
+    def fetch_all_rooms(self, force: bool = False) -> list[dict]:
+        """Fetch every room on the server, following pagination.
+
+        A list fetched less than ``ROOMS_CACHE_TTL`` seconds ago is returned
+        as-is unless ``force`` is set. Callers must not mutate it.
+        """
+        cached = self._rooms_cache
+        if (
+            not force
+            and cached is not None
+            and time.monotonic() - cached[0] < self.ROOMS_CACHE_TTL
+        ):
+            return cached[1]
+
+        fetched_at = time.monotonic()
+        rooms = list(self.iter_rooms())
+        self._rooms_cache = (fetched_at, rooms)
+        # Canonical aliases typed later resolve without a directory lookup
+        self.client.remember_room_aliases(
+            (room["canonical_alias"], room["room_id"])
+            for room in rooms
+            if room.get("canonical_alias")
+        )
+        return rooms
+
+    def invalidate_rooms(self) -> None:
+        """Drop the cached room list after rooms were changed on the server."""
+        self._rooms_cache = None
+
+    def get_room(self, room_id: str) -> dict | None:
+        """Fetch one room's details, or None if the server does not know it."""
+        try:
+            return self.client.make_request(
+                "GET",
+                f"/_synapse/admin/v1/rooms/{urllib.parse.quote(room_id, safe='')}",
+            )
+        except MatrixAPIError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def get_room_index(self, rooms: list[dict]) -> RoomIndex:
+        """Return the column index for ``rooms``, rebuilding it after a refetch."""
+        index = self._room_index
+        if index is None or index.rooms is not rooms:
+            index = self._room_index = RoomIndex(rooms)
+        return index
+
+    @staticmethod
+    def filter_room_indices(
+        index: RoomIndex,
         filter_text: str,
         filter_type: str = "name",
-    ) -> list[dict]:
-        """Filter rooms by various criteria."""
+    ) -> Sequence[int]:
+        """Return positions of rooms in ``index`` matching the filter.
+
+        Without a filter this is a ``range`` over all rooms, so an unfiltered
+        redraw allocates nothing proportional to the room count.
+        """
         if not filter_text:
-            return rooms
+            return range(len(index))
 
         filter_text = filter_text.lower()
-        filtered_rooms = []
-
-        for room in rooms:
-            if filter_type == "name":
-                name = (room.get("name") or "").lower()
-                if filter_text in name:
-                    filtered_rooms.append(room)
-            elif filter_type == "alias":
-                alias = (room.get("canonical_alias") or "").lower()
-                if filter_text in alias:
-                    filtered_rooms.append(room)
-            elif filter_type == "id":
-                room_id = (room.get("room_id") or "").lower()
-                if filter_text in room_id:
-                    filtered_rooms.append(room)
-            elif filter_type == "any":
-                name = (room.get("name") or "").lower()
-                alias = (room.get("canonical_alias") or "").lower()
-                room_id = (room.get("room_id") or "").lower()
-                if (
-                    filter_text in name
-                    or filter_text in alias
-                    or filter_text in room_id
-                ):
-                    filtered_rooms.append(room)
-            elif filter_type == "members":
-                try:
-                    # Support range filtering like "10-50" or ">20" or "<5"
-                    member_count = room.get("joined_members", 0)
-                    if "-" in filter_text:
-                        min_val, max_val = filter_text.split("-", 1)
-                        min_val = int(min_val.strip()) if min_val.strip() else 0
-                        max_val = (
-                            int(max_val.strip()) if max_val.strip() else float("inf")
-                        )
-                        if min_val <= member_count <= max_val:
-                            filtered_rooms.append(room)
-                    elif filter_text.startswith(">"):
-                        threshold = int(filter_text[1:].strip())
-                        if member_count > threshold:
-                            filtered_rooms.append(room)
-                    elif filter_text.startswith("<"):
-                        threshold = int(filter_text[1:].strip())
-                        if member_count < threshold:
-                            filtered_rooms.append(room)
-                    elif filter_text.startswith("="):
-                        threshold = int(filter_text[1:].strip())
-                        if member_count == threshold:
-                            filtered_rooms.append(room)
-                    else:
-                        threshold = int(filter_text.strip())
-                        if member_count == threshold:
-                            filtered_rooms.append(room)
-                except (ValueError, IndexError):
-                    # Invalid member filter, skip
-                    pass
-
-        return filtered_rooms
-
-    def sort_rooms(self, rooms: list[dict], sort_option: str) -> list[dict]:
-        """Sort rooms based on the specified option."""
-        if sort_option == "name_asc":
-            return sorted(rooms, key=lambda r: r.get("name", "").lower())
-        if sort_option == "name_desc":
-            return sorted(rooms, key=lambda r: r.get("name", "").lower(), reverse=True)
-        if sort_option == "alias_asc":
-            return sorted(rooms, key=lambda r: r.get("canonical_alias", "").lower())
-        if sort_option == "alias_desc":
-            return sorted(
-                rooms,
-                key=lambda r: r.get("canonical_alias", "").lower(),
-                reverse=True,
-            )
-        if sort_option == "members_asc":
-            return sorted(rooms, key=lambda r: r.get("joined_members", 0))
-        if sort_option == "members_desc":
-            return sorted(rooms, key=lambda r: r.get("joined_members", 0), reverse=True)
-        if sort_option == "id_asc":
-            return sorted(rooms, key=lambda r: r.get("room_id", "").lower())
-        if sort_option == "id_desc":
-            return sorted(
-                rooms,
-                key=lambda r: r.get("room_id", "").lower(),
-                reverse=True,
+
+        column_name = _TEXT_FILTER_COLUMNS.get(filter_type)
+        if column_name is not None:
+            return index.search(column_name, filter_text)
+        if filter_type == "members":
+            try:
+                predicate = _compile_member_predicate(filter_text)
+            except ValueError:
+                # Invalid member filter matches nothing
+                return []
+            return [i for i, count in enumerate(index.members) if predicate(count)]
+        return []
+
+    @staticmethod
+    def sort_room_indices(
+        index: RoomIndex,
+        indices: Sequence[int],
+        sort_option: str,
+    ) -> list[int]:
+        """Order ``indices`` by one of the precomputed index columns.
+
+        The full ordering of each column is sorted once per index and reused:
+        an unfiltered sort returns it as-is, and a large filtered subset is
+        ordered by a linear pass over it instead of a fresh O(k log k) sort.
+        """
+        field, _, direction = sort_option.rpartition("_")
+        column = index.sort_columns.get(field)
+        if column is None:
+            return list(indices)
+        reverse = direction == "desc"
+
+        if len(indices) == len(index):
+            return index.order(field, reverse)
+        if len(indices) * _ORDER_REUSE_FRACTION >= len(index):
+            selected = bytearray(len(index))
+            for i in indices:
+                selected[i] = 1
+            return [i for i in index.order(field, reverse) if selected[i]]
+        return sorted(indices, key=column.__getitem__, reverse=reverse)
+
+    def room_view(
+        self,
+        index: RoomIndex,
+        indices: Sequence[int],
+        sort_option: str,
+    ) -> RoomView:
+        """View of filtered ``indices`` ordered by ``sort_option``, without copies."""
+        field, _, direction = sort_option.rpartition("_")
+        column = index.sort_columns.get(field)
+        if column is None:
+            return RoomView(index, indices)
+        if len(indices) * _ORDER_REUSE_FRACTION >= len(index):
+            # Cheap off the cached full ordering; no need for a partial sort.
+            return RoomView(
+                index,
+                self.sort_room_indices(index, indices, sort_option),
             )
-        return rooms
+        return RoomView(index, indices, column, reverse=direction == "desc")
 
     def get_room_filter_criteria(self) -> tuple[str, str]:
         """Get filter text and type from user."""
@@ -122,8 +392,8 @@ class RoomManager:
         print("  5. Member count (examples: '5', '>10', '<20', '10-50')")
         print("  0. Cancel")
 
-        while True:
-            try:
+        try:
+            while True:
                 choice = input("Select filter type (0-5): ").strip()
 
                 if choice == "0":
@@ -153,8 +423,8 @@ class RoomManager:
                     filter_text = input("Enter member count filter: ").strip()
                     return filter_text, "members"
                 print("Invalid option. Please choose 0-5.")
-            except KeyboardInterrupt:
-                return "", "name"
+        except KeyboardInterrupt:
+            return "", "name"
 
     def get_room_sort_option(self) -> str:
         """Interactive sort option selection for rooms."""
@@ -169,32 +439,58 @@ class RoomManager:
         print("  8. Room ID (Z-A)")
         print("  0. No sorting")
 
-        while True:
-            try:
-                choice = input("Select sort option (0-8): ").strip()
-                sort_options = {
-                    "0": "none",
-                    "1": "name_asc",
-                    "2": "name_desc",
-                    "3": "alias_asc",
-                    "4": "alias_desc",
-                    "5": "members_asc",
-                    "6": "members_desc",
-                    "7": "id_asc",
-                    "8": "id_desc",
-                }
-
-                if choice in sort_options:
-                    return sort_options[choice]
-                print("Invalid option. Please choose 0-8.")
-            except KeyboardInterrupt:
-                return "none"
+        return FilterSortUI.prompt_option(
+            "Select sort option (0-8): ",
+            _SORT_OPTIONS,
+            "Invalid option. Please choose 0-8.",
+            "none",
+        )
+
+    def format_room_page(
+        self,
+        title: str,
+        index: RoomIndex,
+        paginator: TerminalPaginator,
+        current_filter: str,
+        current_filter_type: str,
+        current_sort: str,
+        total_rooms: int,
+    ) -> list[str]:
+        """Lines of a room list screen up to the rooms on the current page.
+
+        The caller appends its own options and draws the whole frame at once.
+        """
+        lines = self.screen_manager.header_lines(title)
+        lines.extend(
+            FilterSortUI.format_filter_sort_status(
+                current_filter,
+                current_filter_type,
+                current_sort,
+                total_rooms,
+                len(paginator.items),
+                "rooms",
+            ),
+        )
+        if paginator.needs_pagination():
+            lines.append(
+                f"Page {paginator.current_page + 1} of {paginator.total_pages}",
+            )
+        lines.append("")
+
+        if paginator.items:
+            start_index = paginator.get_current_page_start_index()
+            lines.extend(
+                index.format_entry(room, start_index + i)
+                for i, room in enumerate(paginator.get_current_page_items())
+            )
+        else:
+            lines.append("No rooms match the current filter.")
+        return lines
 
     def list_rooms(self) -> None:
         """Enhanced list all rooms with filtering and sorting."""
         try:
-            response = self.client.make_request("GET", "/_synapse/admin/v1/rooms")
-            all_rooms = response.get("rooms", [])
+            all_rooms = self.fetch_all_rooms()
 
             if not all_rooms:
                 self.screen_manager.show_header("Server Rooms")
@@ -206,86 +502,62 @@ class RoomManager:
             current_filter = ""
             current_filter_type = "name"
             current_sort = "none"
-            filtered_rooms = all_rooms.copy()
+            index = self.get_room_index(all_rooms)
+            filter_state = view_state = None
+            paginator = TerminalPaginator((), self.screen_manager)
 
             while True:
-                # Apply current filter and sort
-                if current_filter:
-                    filtered_rooms = self.filter_rooms_by_criteria(
-                        all_rooms,
-                        current_filter,
-                        current_filter_type,
-                    )
-                else:
-                    filtered_rooms = all_rooms.copy()
-
-                if current_sort != "none":
-                    filtered_rooms = self.sort_rooms(filtered_rooms, current_sort)
-
-                # Handle pagination
-                paginator = TerminalPaginator(filtered_rooms, self.screen_manager)
+                # Filter on the precomputed index; rooms are only looked up
+                # (and ordered) for the pages actually displayed. Only redo
+                # the steps whose inputs changed, keeping the page otherwise.
+                if filter_state != (current_filter, current_filter_type):
+                    filter_state = (current_filter, current_filter_type)
+                    indices = self.filter_room_indices(index, *filter_state)
+                    view_state = None
+                if view_state != current_sort:
+                    view_state = current_sort
+                    filtered_rooms = self.room_view(index, indices, current_sort)
+                    paginator.set_items(filtered_rooms)
 
                 # Display rooms
                 while True:
-                    self.screen_manager.show_header("Server Rooms")
-
-                    # Show filter/sort status
-                    FilterSortUI.show_filter_sort_status(
+                    frame = self.format_room_page(
+                        "Server Rooms",
+                        index,
+                        paginator,
                         current_filter,
                         current_filter_type,
                         current_sort,
                         len(all_rooms),
-                        len(filtered_rooms),
-                        "rooms",
                     )
 
-                    if paginator.needs_pagination():
-                        print(
-                            f"Page {paginator.current_page + 1} of {paginator.total_pages}",
-                        )
-
-                    print()
-
-                    # Show rooms
-                    if filtered_rooms:
-                        current_rooms = paginator.get_current_page_items()
-                        start_index = (
-                            paginator.current_page * paginator.items_per_page + 1
-                        )
-
-                        for i, room in enumerate(current_rooms):
-                            print(
-                                DataFormatter.format_room_info_enhanced(
-                                    room,
-                                    start_index + i,
-                                ),
-                            )
-                    else:
-                        print("No rooms match the current filter.")
-
                     # Show navigation options
-                    FilterSortUI.show_navigation_options(
-                        paginator.needs_pagination(),
-                        bool(filtered_rooms),
+                    frame.extend(
+                        FilterSortUI.format_navigation_options(
+                            paginator.needs_pagination(),
+                            bool(filtered_rooms),
+                        ),
                     )
+                    self.screen_manager.draw_frame(frame)
 
                     choice = FilterSortUI.get_navigation_choice()
+                    command = FilterSortUI.list_command(choice)
 
-                    if choice.lower() == "q" or choice.lower() == "quit":
+                    if command == "quit":
                         return
-                    if choice.lower() == "f" or choice.lower() == "filter":
+                    if command == "filter":
                         new_filter, new_filter_type = self.get_room_filter_criteria()
                         current_filter = new_filter
                         current_filter_type = new_filter_type
                         break  # Refresh display
-                    if choice.lower() == "s" or choice.lower() == "sort":
+                    if command == "sort":
                         current_sort = self.get_room_sort_option()
                         break  # Refresh display
-                    if choice.lower() == "c" or choice.lower() == "clear":
+                    if command == "clear":
                         current_filter = ""
                         current_filter_type = "name"
                         break  # Refresh display
-                    if choice.lower() == "r" or choice.lower() == "reset":
+                    if command == "reset":
                         current_filter = ""
                         current_filter_type = "name"
                         current_sort = "none"
@@ -304,8 +576,7 @@ class RoomManager:
     def select_rooms_for_deletion(self) -> list[dict]:
         """Show room list and allow user to select rooms for deletion."""
         try:
-            response = self.client.make_request("GET", "/_synapse/admin/v1/rooms")
-            all_rooms = response.get("rooms", [])
+            all_rooms = self.fetch_all_rooms()
 
             if not all_rooms:
                 self.screen_manager.show_header("Delete Rooms")
@@ -317,93 +588,74 @@ class RoomManager:
             current_filter = ""
             current_filter_type = "name"
             current_sort = "none"
-            filtered_rooms = all_rooms.copy()
+            index = self.get_room_index(all_rooms)
+            filter_state = view_state = None
+            paginator = TerminalPaginator((), self.screen_manager)
 
             while True:
-                # Apply current filter and sort
-                if current_filter:
-                    filtered_rooms = self.filter_rooms_by_criteria(
-                        all_rooms,
-                        current_filter,
-                        current_filter_type,
-                    )
-                else:
-                    filtered_rooms = all_rooms.copy()
-
-                if current_sort != "none":
-                    filtered_rooms = self.sort_rooms(filtered_rooms, current_sort)
-
-                # Handle pagination
-                paginator = TerminalPaginator(filtered_rooms, self.screen_manager)
+                # Filter on the precomputed index; rooms are only looked up
+                # (and ordered) for the pages actually displayed. Only redo
+                # the steps whose inputs changed, keeping the page otherwise.
+                if filter_state != (current_filter, current_filter_type):
+                    filter_state = (current_filter, current_filter_type)
+                    indices = self.filter_room_indices(index, *filter_state)
+                    view_state = None
+                if view_state != current_sort:
+                    view_state = current_sort
+                    filtered_rooms = self.room_view(index, indices, current_sort)
+                    paginator.set_items(filtered_rooms)
 
                 # Display rooms
                 while True:
-                    self.screen_manager.show_header("Delete Rooms - Select from List")
-
-                    # Show filter/sort status
-                    FilterSortUI.show_filter_sort_status(
+                    frame = self.format_room_page(
+                        "Delete Rooms - Select from List",
+                        index,
+                        paginator,
                         current_filter,
                         current_filter_type,
                         current_sort,
                         len(all_rooms),
-                        len(filtered_rooms),
-                        "rooms",
                     )
 
-                    if paginator.needs_pagination():
-                        print(
-                            f"Page {paginator.current_page + 1} of {paginator.total_pages}",
-                        )
-
-                    print()
-
-                    # Show rooms
-                    if filtered_rooms:
-                        current_rooms = paginator.get_current_page_items()
-                        start_index = paginator.get_current_page_start_index()
-
-                        for i, room in enumerate(current_rooms):
-                            global_index = start_index + i
-                            print(
-                                DataFormatter.format_room_info_enhanced(
-                                    room,
-                                    global_index,
-                                ),
-                            )
-                    else:
-                        print("No rooms match the current filter.")
-
                     # Show selection instructions
                     if filtered_rooms:
-                        print("\nSelection:")
                         examples = SelectionParser.format_selection_examples(
                             len(filtered_rooms),
                         )
-                        print(f"  Enter numbers to delete: {examples}")
-                        print("  Or use navigation/filter options below")
+                        frame.extend(
+                            (
+                                "\nSelection:",
+                                f"  Enter numbers to delete: {examples}",
+                                "  Or use navigation/filter options below",
+                            ),
+                        )
 
-                    FilterSortUI.show_navigation_options(
-                        paginator.needs_pagination(),
-                        bool(filtered_rooms),
+                    frame.extend(
+                        FilterSortUI.format_navigation_options(
+                            paginator.needs_pagination(),
+                            bool(filtered_rooms),
+                        ),
                     )
+                    self.screen_manager.draw_frame(frame)
 
                     choice = FilterSortUI.get_navigation_choice()
+                    command = FilterSortUI.list_command(choice)
 
-                    if choice.lower() == "q" or choice.lower() == "quit":
+                    if command == "quit":
                         return []
-                    if choice.lower() == "f" or choice.lower() == "filter":
+                    if command == "filter":
                         new_filter, new_filter_type = self.get_room_filter_criteria()
                         current_filter = new_filter
                         current_filter_type = new_filter_type
                         break  # Refresh display
-                    if choice.lower() == "s" or choice.lower() == "sort":
+                    if command == "sort":
                         current_sort = self.get_room_sort_option()
                         break  # Refresh display
-                    if choice.lower() == "c" or choice.lower() == "clear":
+                    if command == "clear":
                         current_filter = ""
                         current_filter_type = "name"
                         break  # Refresh display
-                    if choice.lower() == "r" or choice.lower() == "reset":
+                    if command == "reset":
                         current_filter = ""
                         current_filter_type = "name"
                         current_sort = "none"
@@ -478,14 +730,7 @@ class RoomManager:
                 room_id, display_name = self.client.resolve_room_identifier(room_input)
 
                 # Find the room object for consistency with batch deletion
-                response = self.client.make_request("GET", "/_synapse/admin/v1/rooms")
-                all_rooms = response.get("rooms", [])
-
-                selected_room = None
-                for room in all_rooms:
-                    if room["room_id"] == room_id:
-                        selected_room = room
-                        break
+                selected_room = self.get_room(room_id)
 
                 if selected_room:
                     self.delete_selected_rooms([selected_room])
@@ -502,22 +747,25 @@ class RoomManager:
 
     def delete_selected_rooms(self, selected_rooms: list[dict]) -> None:
         """Delete the selected rooms after confirmation."""
-        self.screen_manager.show_header("Confirm Room Deletion")
-
-        print(f"You have selected {len(selected_rooms)} room(s) for deletion:")
-        print()
-
-        for i, room in enumerate(selected_rooms, 1):
-            name = room.get("name", "Unnamed room")
-            alias = room.get("canonical_alias", "No alias")
-            members = room.get("joined_members", 0)
-            print(f"{i}. {name}")
-            print(f"   Alias: {alias}")
-            print(f"   Members: {members}")
-            print(f"   ID: {room['room_id']}")
-            print()
-
-        print("⚠️  WARNING: This action cannot be undone!")
+        with self.screen_manager.frame("Confirm Room Deletion") as out:
+            print(
+                f"You have selected {len(selected_rooms)} room(s) for deletion:",
+                file=out,
+            )
+            print(file=out)
+
+            for i, room in enumerate(selected_rooms, 1):
+                name = room.get("name", "Unnamed room")
+                alias = room.get("canonical_alias", "No alias")
+                members = room.get("joined_members", 0)
+                print(f"{i}. {name}", file=out)
+                print(f"   Alias: {alias}", file=out)
+                print(f"   Members: {members}", file=out)
+                print(f"   ID: {room['room_id']}", file=out)
+                print(file=out)
+
+            print("⚠️  WARNING: This action cannot be undone!", file=out)
+
         confirm = (
             input("Are you sure you want to delete these rooms? (yes/no): ")
             .strip()
@@ -533,40 +781,38 @@ class RoomManager:
         purge = input("Purge all room data? (y/n) [default: y]: ").strip().lower()
         purge_data = purge != "n"
 
-        # Process deletions
+        # Process deletions. They are independent, so all DELETE requests are
+        # sent concurrently and the results reported in selection order.
         successful_deletions = []
         failed_deletions = []
 
-        for i, room in enumerate(selected_rooms, 1):
-            room_id = room["room_id"]
+        delete_data = {
+            "block": True,
+            "purge": purge_data,
+            "message": "This room has been deleted by an administrator",
+        }
+        responses = self.client.request_many(
+            ("DELETE", f"/_synapse/admin/v1/rooms/{room['room_id']}", delete_data)
+            for room in selected_rooms
+        )
+
+        for i, (room, response) in enumerate(zip(selected_rooms, responses), 1):
             room_name = room.get("name", "Unnamed room")
 
             ProgressMonitor.show_progress(i, len(selected_rooms), room_name)
 
-            try:
-                delete_data = {
-                    "block": True,
-                    "purge": purge_data,
-                    "message": "This room has been deleted by an administrator",
-                }
-
-                response = self.client.make_request(
-                    "DELETE",
-                    f"/_synapse/admin/v1/rooms/{room_id}",
-                    delete_data,
-                )
-
-                if response and "delete_id" in response:
-                    delete_id = response["delete_id"]
-                    print(f"✓ Deletion initiated. Delete ID: {delete_id}")
-                    successful_deletions.append((room, delete_id))
-                else:
-                    print("✗ Unexpected response format")
-                    failed_deletions.append((room, "Unexpected response"))
-
-            except Exception as e:
-                print(f"✗ Error: {e}")
-                failed_deletions.append((room, str(e)))
+            if isinstance(response, Exception):
+                print(f"✗ Error: {response}")
+                failed_deletions.append((room, str(response)))
+            elif response and "delete_id" in response:
+                delete_id = response["delete_id"]
+                self.client.forget_room_aliases(room["room_id"])
+                self.invalidate_rooms()
+                print(f"✓ Deletion initiated. Delete ID: {delete_id}")
+                successful_deletions.append((room, delete_id))
+            else:
+                print("✗ Unexpected response format")
+                failed_deletions.append((room, "Unexpected response"))
 
         # Show summary
         ProgressMonitor.show_operation_summary(
@@ -578,10 +824,12 @@ class RoomManager:
 
         if successful_deletions:
             print("\nMonitoring deletion progress...")
-            for room, delete_id in successful_deletions:
-                room_name = room.get("name", "Unnamed room")
-                print(f"\nMonitoring: {room_name} (ID: {delete_id})")
-                self.monitor_deletion(delete_id)
+            self.monitor_many(
+                [
+                    (room.get("name", "Unnamed room"), delete_id)
+                    for room, delete_id in successful_deletions
+                ],
+            )
 
         self.screen_manager.pause_for_input()
 
@@ -622,6 +870,8 @@ class RoomManager:
 
             if response and "delete_id" in response:
                 delete_id = response["delete_id"]
+                self.client.forget_room_aliases(room_id)
+                self.invalidate_rooms()
                 print(f"Room deletion initiated. Delete ID: {delete_id}")
 
                 # Monitor deletion progress
@@ -638,7 +888,11 @@ class RoomManager:
         """Monitor room deletion progress."""
         print(f"Monitoring deletion progress for ID: {delete_id}")
 
-        for attempt in range(10):  # Check up to 10 times
+        delays = _backoff_delays(
+            self.DELETE_POLL_INITIAL_DELAY,
+            self.DELETE_POLL_MAX_DELAY,
+        )
+        for attempt in range(self.DELETE_POLL_ATTEMPTS):
             try:
                 response = self.client.make_request(
                     "GET",
@@ -657,14 +911,70 @@ class RoomManager:
                         print(f"  ✗ Room deletion failed: {error}")
                         break
 
-                if attempt < 9:
-                    print("  Checking again in 2 seconds...")
-                    time.sleep(2)
-
             except Exception as e:
                 print(f"  Error checking deletion status: {e}")
                 break
 
+            if attempt < self.DELETE_POLL_ATTEMPTS - 1 and not self._wait_to_poll(
+                next(delays),
+            ):
+                break
+
+    def _wait_to_poll(self, delay: float) -> bool:
+        """Sleep before the next status poll. Returns False if Ctrl+C was pressed."""
+        print(f"  Checking again in {delay:.1f}s... (Ctrl+C to stop waiting)")
+        try:
+            time.sleep(delay)
+        except KeyboardInterrupt:
+            print("\n  Stopped monitoring; deletion continues on the server.")
+            return False
+        return True
+
+    def monitor_many(self, deletions: list[tuple[str, str]]) -> None:
+        """Monitor several room deletions, given as ``(name, delete_id)`` pairs.
+
+        Each round polls all unfinished deletions concurrently and prints one
+        status table; the wait between rounds backs off like monitor_deletion.
+        """
+        pending = list(deletions)
+        delays = _backoff_delays(
+            self.DELETE_POLL_INITIAL_DELAY,
+            self.DELETE_POLL_MAX_DELAY,
+        )
+
+        for attempt in range(self.DELETE_POLL_ATTEMPTS):
+            responses = self.client.request_many(
+                ("GET", f"/_synapse/admin/v1/rooms/delete_status/{delete_id}", None)
+                for _, delete_id in pending
+            )
+
+            print(f"\nDeletion status ({len(pending)} in progress):")
+            still_pending = []
+            for (name, delete_id), response in zip(pending, responses):
+                if isinstance(response, Exception):
+                    print(f"  ✗ {name}: error checking status: {response}")
+                    continue
+
+                status = (response or {}).get("status", "unknown")
+                if status == "complete":
+                    print(f"  ✓ {name}: deletion completed successfully")
+                elif status == "failed":
+                    error = response.get("error", "Unknown error")
+                    print(f"  ✗ {name}: deletion failed: {error}")
+                else:
+                    print(f"  … {name}: {status}")
+                    still_pending.append((name, delete_id))
+
+            pending = still_pending
+            if not pending:
+                return
+            if attempt < self.DELETE_POLL_ATTEMPTS - 1 and not self._wait_to_poll(
+                next(delays),
+            ):
+                break
+
+        print(f"\n{len(pending)} deletion(s) still in progress; check again later.")
+
     def fix_room_permissions(self) -> None:
         """Fix room permissions for Element Call."""
         self.screen_manager.show_header("Fix Room Permissions for Element Call")
@@ -678,56 +988,80 @@ class RoomManager:
 
         self.screen_manager.pause_for_input()
 
+    def apply_element_call_permissions(self, room_id: str) -> str | None:
+        """Let all members use Element Call in ``room_id``.
+
+        Returns the event ID of the updated power levels, or None if the room
+        already allowed Element Call and nothing was sent; raises on failure.
+        Prints nothing, so it can run on worker threads.
+        """
+        # Get current power levels
+        power_levels = self.client.make_request(
+            "GET",
+            f"/_matrix/client/v3/rooms/{room_id}/state/m.room.power_levels",
+        )
+
+        if not power_levels or "events" not in power_levels:
+            msg = "Could not retrieve power levels"
+            raise Exception(msg)
+
+        # Update power levels for Element Call
+        events = power_levels["events"]
+        new_events = {**events, **_ELEMENT_CALL_EVENT_POWERS}
+        if new_events == events:
+            # Sending identical power levels would only add a state event
+            return None
+        power_levels["events"] = new_events
+
+        # Apply changes
+        response = self.client.make_request(
+            "PUT",
+            f"/_matrix/client/v3/rooms/{room_id}/state/m.room.power_levels",
+            power_levels,
+        )
+
+        if not response or "event_id" not in response:
+            msg = "Failed to update permissions"
+            raise Exception(msg)
+        return response["event_id"]
+
     def fix_single_room_permissions(self, room_input: str) -> None:
-        """Fix permissions for a single room."""
+        """Fix permissions for a single room given by alias or ID."""
         try:
             room_id, display_name = self.client.resolve_room_identifier(room_input)
+        except Exception as e:
+            print(f"Error fixing permissions: {e}")
+            return
 
-            print(f"\nFixing permissions for: {display_name}")
+        self.fix_single_room_permissions_by_id(room_id, display_name)
 
-            # Get current power levels
-            power_levels = self.client.make_request(
-                "GET",
-                f"/_matrix/client/v3/rooms/{room_id}/state/m.room.power_levels",
-            )
+    def fix_single_room_permissions_by_id(
+        self,
+        room_id: str,
+        display_name: str,
+    ) -> None:
+        """Fix permissions for a single room whose ID is already resolved."""
+        try:
+            print(f"\nFixing permissions for: {display_name}")
 
-            if not power_levels or "events" not in power_levels:
-                print("Could not retrieve power levels")
+            event_id = self.apply_element_call_permissions(room_id)
+            if event_id is None:
+                print("Permissions already allow Element Call; nothing to update.")
                 return
-
-            # Update power levels for Element Call
-            events = power_levels.get("events", {})
-            events.update(
-                {
-                    "org.matrix.msc3401.call.member": 0,
-                    "org.matrix.msc3401.call": 0,
-                    "m.call.member": 0,
-                    "m.call": 0,
-                },
-            )
-            power_levels["events"] = events
-
-            # Apply changes
-            response = self.client.make_request(
-                "PUT",
-                f"/_matrix/client/v3/rooms/{room_id}/state/m.room.power_levels",
-                power_levels,
-            )
-
-            if response and "event_id" in response:
-                print("Permissions updated successfully!")
-                print(f"  Event ID: {response['event_id']}")
-            else:
-                print("Failed to update permissions")
+            print("Permissions updated successfully!")
+            print(f"  Event ID: {event_id}")
 
         except Exception as e:
             print(f"Error fixing permissions: {e}")
 
     def fix_all_room_permissions(self) -> None:
-        """Fix permissions for all rooms."""
+        """Fix permissions for all rooms.
+
+        Rooms are updated concurrently (two requests each) over the client's
+        connection pool; results are reported in room order.
+        """
         try:
-            response = self.client.make_request("GET", "/_synapse/admin/v1/rooms")
-            rooms = response.get("rooms", [])
+            rooms = self.fetch_all_rooms()
 
             if not rooms:
                 print("No rooms found.")
@@ -736,23 +1070,36 @@ class RoomManager:
             print(f"Fixing permissions for {len(rooms)} rooms...")
 
             success_count = 0
+            unchanged_count = 0
             failed_count = 0
 
-            for i, room in enumerate(rooms, 1):
-                room_id = room["room_id"]
-                room_name = room.get("name", "Unnamed room")
-
-                ProgressMonitor.show_progress(i, len(rooms), room_name)
-
+            def fix(room: dict) -> str | Exception | None:
                 try:
-                    self.fix_single_room_permissions(room_id)
-                    success_count += 1
+                    return self.apply_element_call_permissions(room["room_id"])
                 except Exception as e:
-                    print(f"  Failed: {e}")
-                    failed_count += 1
+                    return e
+
+            with ThreadPoolExecutor(
+                max_workers=self.client.MAX_CONCURRENT_REQUESTS,
+            ) as executor:
+                results = executor.map(fix, rooms)
+                for i, (room, result) in enumerate(zip(rooms, results), 1):
+                    room_name = room.get("name", "Unnamed room")
+                    ProgressMonitor.show_progress(i, len(rooms), room_name)
+
+                    if isinstance(result, Exception):
+                        print(f"  Failed: {result}")
+                        failed_count += 1
+                    elif result is None:
+                        print("  Already configured.")
+                        unchanged_count += 1
+                    else:
+                        print(f"  Permissions updated. Event ID: {result}")
+                        success_count += 1
 
             print("\nSummary:")
             print(f"  Successfully updated: {success_count}")
+            print(f"  Already configured: {unchanged_count}")
             print(f"  Failed: {failed_count}")
 
         except Exception as e:
@@ -776,23 +1123,16 @@ class RoomManager:
 
         if room_choice == "1":
             try:
-                response = self.client.make_request("GET", "/_synapse/admin/v1/rooms")
-                all_rooms = response.get("rooms", [])
+                all_rooms = self.fetch_all_rooms()
 
-                search_term = (
-                    input("\nEnter room name, alias, or ID to search: ").strip().lower()
-                )
-                matches = []
-                for r in all_rooms:
-                    name = (r.get("name") or "").lower()
-                    alias = (r.get("canonical_alias") or "").lower()
-                    r_id = (r.get("room_id") or "").lower()
-                    if (
-                        search_term in name
-                        or search_term in alias
-                        or search_term in r_id
-                    ):
-                        matches.append(r)
+                search_term = input(
+                    "\nEnter room name, alias, or ID to search: ",
+                ).strip()
+                index = self.get_room_index(all_rooms)
+                matches = [
+                    all_rooms[i]
+                    for i in self.filter_room_indices(index, search_term, "any")
+                ]
 
                 if not matches:
                     print("No matching rooms found.")
@@ -861,20 +1201,21 @@ class RoomManager:
 
         if user_choice == "1":
             try:
-                response = self.client.make_request("GET", "/_synapse/admin/v2/users")
-                all_users = response.get("users", [])
+                all_users = list(
+                    self.client.paginate(
+                        "/_synapse/admin/v2/users",
+                        "users",
+                        total_key="total",
+                    ),
+                )
 
                 search_term = (
                     input("\nEnter username or display name to search: ")
                     .strip()
                     .lower()
                 )
-                matches = []
-                for u in all_users:
-                    u_id = (u.get("name") or "").lower()
-                    u_disp = (u.get("displayname") or "").lower()
-                    if search_term in u_id or search_term in u_disp:
-                        matches.append(u)
+                user_index = UserIndex(all_users)
+                matches = [all_users[i] for i in user_index.search(search_term)]
 
                 if not matches:
                     print("No matching users found.")
@@ -939,22 +1280,23 @@ class RoomManager:
         success_count = 0
         failed_count = 0
 
-        for user_id in target_users:
+        # Joins are independent, so send them concurrently and report in order
+        responses = self.client.request_many(
+            ("POST", f"/_synapse/admin/v1/join/{encoded_room}", {"user_id": user_id})
+            for user_id in target_users
+        )
+        for user_id, response in zip(target_users, responses):
             print(f"Attempting to join {user_id}... ", end="")
-            try:
-                join_data = {"user_id": user_id}
-                response = self.client.make_request(
-                    "POST", f"/_synapse/admin/v1/join/{encoded_room}", join_data
-                )
-
-                if response and "room_id" in response:
-                    print("Success!")
-                    success_count += 1
-                else:
-                    print("Unexpected response.")
-                    failed_count += 1
-            except Exception as e:
-                print(f"Failed: {e}")
+            if isinstance(response, Exception):
+                print(f"Failed: {response}")
+                failed_count += 1
+            elif response and "room_id" in response:
+                print("Success!")
+                success_count += 1
+                # Member counts in the cached room list are now stale
+                self.invalidate_rooms()
+            else:
+                print("Unexpected response.")
                 failed_count += 1
 
         print(
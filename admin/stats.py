@@ -1,5 +1,7 @@
 """Server statistics and monitoring functionality for Matrix administration."""
 
+from __future__ import annotations
+
 from .core import MatrixClient
 from .ui import ScreenManager
 
@@ -19,39 +21,46 @@ class StatsManager:
             # Get basic stats
             stats = {}
 
-            # User count
-            try:
-                users_response = self.client.make_request(
-                    "GET",
+            # The summary and breakdown requests are independent; send them
+            # all at once instead of one round trip after another
+            (
+                users_response,
+                rooms_response,
+                media_response,
+                users_page,
+                rooms_page,
+            ) = self.client.request_many(
+                ("GET", endpoint, None)
+                for endpoint in (
                     "/_synapse/admin/v2/users?limit=1",
+                    "/_synapse/admin/v1/rooms?limit=1",
+                    "/_synapse/admin/v1/statistics/users/media",
+                    "/_synapse/admin/v2/users?limit=1000",
+                    "/_synapse/admin/v1/rooms?limit=1000",
                 )
+            )
+
+            # User count
+            try:
+                if isinstance(users_response, Exception):
+                    raise users_response
                 stats["total_users"] = users_response.get("total", 0)
             except Exception:
                 stats["total_users"] = "N/A"
 
             # Room count
             try:
-                rooms_response = self.client.make_request(
-                    "GET",
-                    "/_synapse/admin/v1/rooms?limit=1",
-                )
+                if isinstance(rooms_response, Exception):
+                    raise rooms_response
                 stats["total_rooms"] = rooms_response.get("total_rooms", 0)
             except Exception:
                 stats["total_rooms"] = "N/A"
 
             # Media statistics
-            try:
-                media_response = self.client.make_request(
-                    "GET",
-                    "/_synapse/admin/v1/statistics/users/media",
-                )
-                if media_response:
-                    stats["media_count"] = media_response.get("total_media_length", 0)
-                    stats["media_size"] = media_response.get("total_media_size", 0)
-                else:
-                    stats["media_count"] = "N/A"
-                    stats["media_size"] = "N/A"
-            except Exception:
+            if media_response and not isinstance(media_response, Exception):
+                stats["media_count"] = media_response.get("total_media_length", 0)
+                stats["media_size"] = media_response.get("total_media_size", 0)
+            else:
                 stats["media_count"] = "N/A"
                 stats["media_size"] = "N/A"
 
@@ -67,15 +76,22 @@ class StatsManager:
                 print(f"Media Storage: {stats['media_size']}")
 
             # Try to get additional statistics
-            self._show_detailed_stats()
+            self._show_detailed_stats(users_page, rooms_page)
 
         except Exception as e:
             print(f"Error retrieving server statistics: {e}")
 
         self.screen_manager.pause_for_input()
 
-    def _show_detailed_stats(self) -> None:
-        """Show detailed server statistics if available."""
+    def _show_detailed_stats(
+        self,
+        users_response: dict | None | Exception,
+        rooms_response: dict | None | Exception,
+    ) -> None:
+        """Show detailed server statistics from already fetched list pages.
+
+        Each response may be the exception its request failed with.
+        """
         try:
             print("\n" + "=" * 40)
             print("DETAILED STATISTICS")
@@ -83,10 +99,8 @@ class StatsManager:
 
             # User activity breakdown
             try:
-                users_response = self.client.make_request(
-                    "GET",
-                    "/_synapse/admin/v2/users?limit=1000",
-                )
+                if isinstance(users_response, Exception):
+                    raise users_response
                 all_users = users_response.get("users", [])
 
                 if all_users:
@@ -106,10 +120,8 @@ class StatsManager:
 
             # Room activity breakdown
             try:
-                rooms_response = self.client.make_request(
-                    "GET",
-                    "/_synapse/admin/v1/rooms?limit=1000",
-                )
+                if isinstance(rooms_response, Exception):
+                    raise rooms_response
                 all_rooms = rooms_response.get("rooms", [])
 
                 if all_rooms:
@@ -148,7 +160,7 @@ class StatsManager:
         print("Testing connection to Matrix server...")
         print(f"Server: {self.client.base_url}")
 
-        if self.client.test_connection():
+        if self.client.test_connection(force=True):
             print("Connection test successful!")
 
             # Test admin privileges
@@ -2,6 +2,7 @@
 
 import secrets
 from datetime import datetime, timedelta
+from typing import TextIO
 
 from .core import MatrixClient
 from .ui import FilterSortUI, ScreenManager, TerminalPaginator
@@ -222,53 +223,59 @@ class TokenManager:
 
             tokens = response.get("registration_tokens", [])
 
+            # Collect the whole listing and write it to the terminal at once
+            with self.screen_manager.frame("Registration Tokens") as out:
+                if not tokens:
+                    print("No registration tokens found.", file=out)
+                else:
+                    self.print_token_list(tokens, out)
+
+        except Exception as e:
             self.screen_manager.show_header("Registration Tokens")
+            print(f"Error listing tokens: {e}")
 
-            if not tokens:
-                print("No registration tokens found.")
-                self.screen_manager.pause_for_input()
-                return
+        self.screen_manager.pause_for_input()
 
-            print(f"Found {len(tokens)} registration token(s):\n")
+    @staticmethod
+    def print_token_list(tokens: list[dict], out: TextIO) -> None:
+        """Print numbered token details (uses, expiry) to ``out``."""
+        print(f"Found {len(tokens)} registration token(s):\n", file=out)
 
-            for i, token in enumerate(tokens, 1):
-                token_str = token["token"]
-                uses_allowed = token.get("uses_allowed")
-                completed = token.get("completed", 0)
-                pending = token.get("pending", 0)
-                expiry_time = token.get("expiry_time")
+        for i, token in enumerate(tokens, 1):
+            token_str = token["token"]
+            uses_allowed = token.get("uses_allowed")
+            completed = token.get("completed", 0)
+            pending = token.get("pending", 0)
+            expiry_time = token.get("expiry_time")
 
-                print(f"{i}. Token: {token_str}")
+            print(f"{i}. Token: {token_str}", file=out)
 
-                if uses_allowed is None:
-                    print("   Uses: Unlimited")
-                else:
-                    remaining = uses_allowed - completed - pending
+            if uses_allowed is None:
+                print("   Uses: Unlimited", file=out)
+            else:
+                remaining = uses_allowed - completed - pending
+                print(
+                    f"   Uses: {completed} completed, {pending} pending, {remaining} remaining",
+                    file=out,
+                )
+
+            if expiry_time:
+                expiry_date = datetime.fromtimestamp(expiry_time / 1000)
+                now = datetime.now()
+                if expiry_date < now:
                     print(
-                        f"   Uses: {completed} completed, {pending} pending, {remaining} remaining"
+                        f"   Status: ⚠️ EXPIRED ({expiry_date.strftime('%Y-%m-%d %H:%M')})",
+                        file=out,
                     )
-
-                if expiry_time:
-                    expiry_date = datetime.fromtimestamp(expiry_time / 1000)
-                    now = datetime.now()
-                    if expiry_date < now:
-                        print(
-                            f"   Status: ⚠️ EXPIRED ({expiry_date.strftime('%Y-%m-%d %H:%M')})"
-                        )
-                    else:
-                        print(
-                            f"   Expires: {expiry_date.strftime('%Y-%m-%d %H:%M:%S')}"
-                        )
                 else:
-                    print("   Expires: Never")
-
-                print()
-
-        except Exception as e:
-            self.screen_manager.show_header("Registration Tokens")
-            print(f"Error listing tokens: {e}")
+                    print(
+                        f"   Expires: {expiry_date.strftime('%Y-%m-%d %H:%M:%S')}",
+                        file=out,
+                    )
+            else:
+                print("   Expires: Never", file=out)
 
-        self.screen_manager.pause_for_input()
+            print(file=out)
 
     def export_existing_tokens(self) -> None:
         """Export existing registration tokens to a file."""
@@ -437,18 +444,18 @@ class TokenManager:
 
             # Display tokens
             while True:
-                self.screen_manager.show_header(
+                frame = self.screen_manager.header_lines(
                     "Delete Registration Tokens - Select from List"
                 )
 
-                print(f"Total tokens: {len(all_tokens)}")
+                frame.append(f"Total tokens: {len(all_tokens)}")
 
                 if paginator.needs_pagination():
-                    print(
+                    frame.append(
                         f"Page {paginator.current_page + 1} of {paginator.total_pages}"
                     )
 
-                print()
+                frame.append("")
 
                 # Show tokens
                 current_tokens = paginator.get_current_page_items()
@@ -456,27 +463,30 @@ class TokenManager:
 
                 for i, token in enumerate(current_tokens):
                     global_index = start_index + i
-                    print(self.format_token_for_selection(token, global_index))
+                    frame.append(self.format_token_for_selection(token, global_index))
 
                 # Show selection instructions
-                print("\nSelection:")
+                frame.append("\nSelection:")
                 examples = SelectionParser.format_selection_examples(len(all_tokens))
-                print(f"  Enter numbers to delete: {examples}")
-                print("  Or use navigation options below")
+                frame.append(f"  Enter numbers to delete: {examples}")
+                frame.append("  Or use navigation options below")
 
                 # Show navigation options
                 if paginator.needs_pagination():
-                    print("\nNavigation:")
-                    print(
+                    frame.append("\nNavigation:")
+                    frame.append(
                         "  [Enter] Next page  [p] Previous page  [g] Go to page  [q] Cancel"
                     )
                 else:
-                    print("\nOptions:")
-                    print("  [q] Cancel")
+                    frame.append("\nOptions:")
+                    frame.append("  [q] Cancel")
+
+                # One write per frame
+                self.screen_manager.draw_frame(frame)
 
                 choice = input("\nAction: ").strip()
 
-                if choice.lower() == "q" or choice.lower() == "quit":
+                if FilterSortUI.list_command(choice) == "quit":
                     return []
 
                 # Handle pagination
@@ -2,30 +2,128 @@
 
 from __future__ import annotations
 
+import io
+import os
 import shutil
+import signal
+import sys
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from typing import Any
 
+# Bumped by the SIGWINCH handler so every ScreenManager notices a resize.
+_resize_count = 0
+# Python-level SIGWINCH handler installed before ours; called from ours.
+_previous_resize_handler: Any = None
+
+# List screen commands by every accepted spelling, lowercase.
+_LIST_COMMANDS = {
+    "q": "quit",
+    "quit": "quit",
+    "f": "filter",
+    "filter": "filter",
+    "s": "sort",
+    "sort": "sort",
+    "c": "clear",
+    "clear": "clear",
+    "r": "reset",
+    "reset": "reset",
+}
+
+
+def _on_resize(signum: int, frame: Any) -> None:
+    global _resize_count
+    _resize_count += 1
+    if callable(_previous_resize_handler):
+        _previous_resize_handler(signum, frame)
+
 
 class ScreenManager:
     """Manage terminal screen state and clearing."""
 
+    # How long a measured size is trusted when resizes are not signalled.
+    SIZE_TTL = 0.5
+
+    _resize_handler_installed = False
+
     def __init__(self) -> None:
-        self.terminal_size = shutil.get_terminal_size()
+        self._watch_resize = self._install_resize_handler()
+        self.refresh_size()
         self.last_operation = None
 
+    @classmethod
+    def _install_resize_handler(cls) -> bool:
+        """Install the SIGWINCH handler once. Returns True if resizes are signalled."""
+        if cls._resize_handler_installed:
+            return True
+        if not hasattr(signal, "SIGWINCH") or "readline" in sys.modules:
+            # readline installs its own SIGWINCH handler in C, which Python
+            # cannot see or chain to; keep it and use time-based refreshes.
+            return False
+        global _previous_resize_handler
+        try:
+            previous = signal.getsignal(signal.SIGWINCH)
+            signal.signal(signal.SIGWINCH, _on_resize)
+        except ValueError:
+            # Not on the main thread; fall back to time-based refreshes.
+            return False
+        _previous_resize_handler = previous
+        cls._resize_handler_installed = True
+        return True
+
+    @property
+    def terminal_size(self) -> os.terminal_size:
+        """Cached terminal size, re-measured only after a resize or TTL expiry."""
+        if self._watch_resize:
+            if self._size_resize_count != _resize_count:
+                self.refresh_size()
+        elif time.monotonic() - self._size_checked_at >= self.SIZE_TTL:
+            self.refresh_size()
+        return self._terminal_size
+
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
         print("\033[2J\033[H", end="")
 
     def refresh_size(self) -> None:
         """Refresh terminal size information."""
-        self.terminal_size = shutil.get_terminal_size()
+        self._terminal_size = shutil.get_terminal_size()
+        self._size_checked_at = time.monotonic()
+        self._size_resize_count = _resize_count
+
+    def header_lines(self, title: str) -> list[str]:
+        """Title and rule lines of a header."""
+        return [title, "=" * min(50, self.terminal_size.columns - 2)]
+
+    def format_header(self, title: str) -> str:
+        """Screen clear sequence plus header, as written by ``show_header``."""
+        return "\033[2J\033[H" + "\n".join(self.header_lines(title)) + "\n"
 
     def show_header(self, title: str) -> None:
         """Show a consistent header for operations."""
-        self.clear_screen()
-        print(title)
-        print("=" * min(50, self.terminal_size.columns - 2))
+        self.write_frame([self.format_header(title)])
+
+    def write_frame(self, parts: list[str]) -> None:
+        """Write a whole frame with a single write and flush."""
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
+
+    @contextmanager
+    def frame(self, title: str) -> Iterator[io.StringIO]:
+        """Collect a screen starting with the header for ``title``.
+
+        Text written (or printed with ``file=``) to the yielded buffer is
+        written out with a single ``write_frame`` call when the block exits.
+        """
+        out = io.StringIO()
+        out.write(self.format_header(title))
+        yield out
+        self.write_frame([out.getvalue()])
+
+    def draw_frame(self, lines: list[str]) -> None:
+        """Clear the screen and draw ``lines`` as one frame."""
+        self.write_frame(["\033[2J\033[H", "\n".join(lines), "\n"])
 
     def pause_for_input(self, message: str = "Press Enter to continue...") -> None:
         """Pause and wait for user input."""
@@ -36,33 +134,44 @@ class ScreenManager:
 
 
 class TerminalPaginator:
-    """Handle terminal-based pagination for large lists."""
+    """Handle terminal-based pagination for large lists.
+
+    ``items`` is kept by reference and only the current page is sliced out.
+    """
 
     def __init__(
         self,
-        items: list[Any],
+        items: Sequence[Any],
         screen_manager: ScreenManager,
         items_per_page: int | None = None,
     ) -> None:
-        self.items = items
         self.screen_manager = screen_manager
+        # Without an explicit page size, fit pages to the terminal height
+        self._fit_to_terminal = items_per_page is None
+        if items_per_page is not None:
+            self.items_per_page = items_per_page
+        self.set_items(items)
+
+    def set_items(self, items: Sequence[Any]) -> None:
+        """Page over ``items`` instead, starting again from the first page.
+
+        Lets list screens keep one paginator across filter and sort changes.
+        """
+        self.items = items
         self.current_page = 0
 
-        # Calculate items per page based on terminal height if not specified
-        if items_per_page is None:
+        if self._fit_to_terminal:
             # Reserve space for header, navigation, and prompt
             available_lines = max(5, self.screen_manager.terminal_size.lines - 12)
             self.items_per_page = available_lines
-        else:
-            self.items_per_page = items_per_page
 
-        self.total_pages = max(1, (len(self.items) - 1) // self.items_per_page + 1)
+        self.total_pages = max(1, -(-len(self.items) // self.items_per_page))
 
     def needs_pagination(self) -> bool:
         """Check if pagination is needed."""
         return self.total_pages > 1
 
-    def get_current_page_items(self) -> list[Any]:
+    def get_current_page_items(self) -> Sequence[Any]:
         """Get items for the current page."""
         start_idx = self.current_page * self.items_per_page
         end_idx = start_idx + self.items_per_page
@@ -91,8 +200,8 @@ class TerminalPaginator:
 
         self.show_navigation_help()
 
-        while True:
-            try:
+        try:
+            while True:
                 choice = input("\nAction: ").strip().lower()
 
                 if choice in {"q", "quit"}:
@@ -121,24 +230,44 @@ class TerminalPaginator:
                 else:
                     print("Invalid option. Use Enter, p, g, or q.")
 
-            except KeyboardInterrupt:
-                return False
+        except KeyboardInterrupt:
+            return False
 
 
 class FilterSortUI:
     """UI components for filtering and sorting operations."""
 
     @staticmethod
-    def show_filter_sort_status(
+    def prompt_option(
+        prompt: str,
+        options: Mapping[str, Any],
+        invalid_message: str,
+        cancelled: Any,
+    ) -> Any:
+        """Ask until the answer is a key of ``options`` and return its value.
+
+        Ctrl+C at the prompt returns ``cancelled``.
+        """
+        try:
+            while True:
+                choice = input(prompt).strip()
+                if choice in options:
+                    return options[choice]
+                print(invalid_message)
+        except KeyboardInterrupt:
+            return cancelled
+
+    @staticmethod
+    def format_filter_sort_status(
         current_filter: str,
         current_filter_type: str,
         current_sort: str,
         total_items: int,
         filtered_count: int,
         item_type: str = "items",
-    ) -> None:
-        """Display current filter and sort status."""
-        print(f"{item_type.title()}: {filtered_count}/{total_items}")
+    ) -> list[str]:
+        """Lines of the filter and sort status."""
+        lines = [f"{item_type.title()}: {filtered_count}/{total_items}"]
 
         if current_filter:
             if current_filter_type:
@@ -153,12 +282,13 @@ class FilterSortUI:
                     current_filter_type,
                     current_filter_type,
                 )
-                print(f"Filter: '{current_filter}' ({filter_type_display})")
+                lines.append(f"Filter: '{current_filter}' ({filter_type_display})")
             else:
-                print(f"Filter: '{current_filter}'")
+                lines.append(f"Filter: '{current_filter}'")
 
         if current_sort != "none":
-            print(f"Sort: {current_sort}")
+            lines.append(f"Sort: {current_sort}")
+        return lines
 
     @staticmethod
     def get_navigation_choice() -> str:
@@ -168,6 +298,14 @@ class FilterSortUI:
         except KeyboardInterrupt:
             return "q"
 
+    @staticmethod
+    def list_command(choice: str) -> str | None:
+        """Normalize a list screen choice ("q", "Filter", ...) to its command.
+
+        Returns None for page navigation, selections and unknown input.
+        """
+        return _LIST_COMMANDS.get(choice.lower())
+
     @staticmethod
     def handle_pagination_navigation(choice: str, paginator: TerminalPaginator) -> bool:
         """Handle pagination navigation commands. Returns True if page changed."""
@@ -209,18 +347,18 @@ class FilterSortUI:
         return False
 
     @staticmethod
-    def show_navigation_options(has_pagination: bool, has_items: bool) -> None:
-        """Show available navigation options."""
+    def format_navigation_options(has_pagination: bool, has_items: bool) -> list[str]:
+        """Lines of the available navigation options."""
         if has_pagination and has_items:
-            print("\nNavigation:")
-            print("  [Enter] Next page  [p] Previous page  [g] Go to page")
-            print(
+            return [
+                "\nNavigation:",
+                "  [Enter] Next page  [p] Previous page  [g] Go to page",
                 "  [f] Filter  [s] Sort  [c] Clear filter  [r] Reset  [q] Cancel/Quit",
-            )
-        else:
-            print("\nOptions:")
-            print(
-                "  [f] Filter  [s] Sort  [c] Clear filter  [r] Reset  [q] Cancel/Quit",
-            )
-            if not has_items:
-                print("  [Enter] Continue")
+            ]
+        lines = [
+            "\nOptions:",
+            "  [f] Filter  [s] Sort  [c] Clear filter  [r] Reset  [q] Cancel/Quit",
+        ]
+        if not has_items:
+            lines.append("  [Enter] Continue")
+        return lines
@@ -1,64 +1,221 @@
 """User management functionality for Matrix administration."""
 
+from __future__ import annotations
+
 import getpass
+import urllib.parse
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from functools import cached_property
 
-from .core import MatrixClient
+from .core import MatrixAPIError, MatrixClient
 from .ui import FilterSortUI, ScreenManager, TerminalPaginator
 from .utils import DataFormatter, ProgressMonitor, SelectionParser
 
 
+def _role_rank(user: dict) -> int:
+    """Sort rank by role: admins first, then regular users, then deactivated."""
+    if user.get("deactivated", False):
+        return 2
+    if user.get("admin", False):
+        return 0
+    return 1
+
+
+# Formatted user list pages kept per UserIndex.
+_PAGE_CACHE_SIZE = 8
+
+# Sort option for each choice of the sort menu.
+_SORT_OPTIONS = {
+    "0": "none",
+    "1": "name_asc",
+    "2": "name_desc",
+    "3": "display_asc",
+    "4": "display_desc",
+    "5": "role",
+}
+
+
+class UserIndex:
+    """Lowercased column views over a fetched user list.
+
+    Sort keys are computed once per fetch instead of on every sort, so a
+    re-sort only orders positions by a precomputed list. Results are
+    positions into ``users``.
+    """
+
+    def __init__(self, users: list[dict]) -> None:
+        self.users = users
+        self.names = [(user.get("name") or "").lower() for user in users]
+        self.displaynames = [
+            (user.get("displayname") or "").lower() for user in users
+        ]
+        self.roles = [
+            (_role_rank(user), name) for user, name in zip(users, self.names)
+        ]
+        self.sort_columns = {
+            "name": self.names,
+            "display": self.displaynames,
+            "role": self.roles,
+        }
+
+        self._last_filter: tuple[str, list[int]] | None = None
+        self._entries: dict[int, str] = {}
+        self._pages: OrderedDict[tuple, list[str]] = OrderedDict()
+        self._orders: dict[tuple[str, bool], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def format_entry(self, user: dict, number: int) -> str:
+        """Display entry for one of the indexed users, numbered ``number``.
+
+        The entry text is formatted once per user and reused on later frames.
+        """
+        entry = self._entries.get(id(user))
+        if entry is None:
+            entry = self._entries[id(user)] = DataFormatter.format_user_entry(user)
+        return f"{number:3d}. {entry}"
+
+    def order(self, field: str, reverse: bool = False) -> list[int]:
+        """Positions of all users sorted by ``field``, computed once per index.
+
+        The returned list is shared between callers and must not be mutated.
+        """
+        key = (field, reverse)
+        order = self._orders.get(key)
+        if order is None:
+            column = self.sort_columns[field]
+            order = self._orders[key] = sorted(
+                range(len(column)),
+                key=column.__getitem__,
+                reverse=reverse,
+            )
+        return order
+
+    def format_page(
+        self,
+        key: tuple,
+        positions: Sequence[int],
+        start_number: int,
+    ) -> list[str]:
+        """Entries for one page of ``positions``, numbered from ``start_number``.
+
+        ``key`` must identify the page (filter, sort and page number); the
+        last few pages are kept so redraws and back-navigation reuse them.
+        """
+        entries = self._pages.get(key)
+        if entries is not None:
+            self._pages.move_to_end(key)
+            return entries
+
+        users = self.users
+        entries = [
+            self.format_entry(users[position], start_number + i)
+            for i, position in enumerate(positions)
+        ]
+        self._pages[key] = entries
+        if len(self._pages) > _PAGE_CACHE_SIZE:
+            self._pages.popitem(last=False)
+        return entries
+
+    @cached_property
+    def search_keys(self) -> list[str]:
+        """User ID and display name per user joined by NUL, for name filters."""
+        return [
+            f"{user_id}\0{display_name}"
+            for user_id, display_name in zip(self.names, self.displaynames)
+        ]
+
+    def search(self, needle: str) -> list[int]:
+        """Positions of users whose search key contains lowercase ``needle``.
+
+        The last result is kept, so redrawing with an unchanged filter does not
+        rescan, and a filter containing the last one (e.g. one more character
+        typed) only rescans the users that matched before. The returned list
+        is shared and must not be mutated.
+        """
+        keys = self.search_keys
+        if self._last_filter is not None:
+            last_needle, last_indices = self._last_filter
+            if last_needle == needle:
+                return last_indices
+            if last_needle in needle:
+                # Anything containing the longer needle contained the shorter
+                indices = [i for i in last_indices if needle in keys[i]]
+                self._last_filter = (needle, indices)
+                return indices
+
+        indices = [i for i, key in enumerate(keys) if needle in key]
+        self._last_filter = (needle, indices)
+        return indices
+
+
 class UserManager:
     """Manage Matrix users through the admin API."""
 
     def __init__(self, client: MatrixClient, screen_manager: ScreenManager) -> None:
         self.client = client
         self.screen_manager = screen_manager
+        self._user_index: UserIndex | None = None
+
+    def iter_users(self) -> Iterator[dict]:
+        """Stream active users from the admin API, fetching pages concurrently."""
+        return self.client.paginate(
+            "/_synapse/admin/v2/users",
+            "users",
+            total_key="total",
+        )
 
-    def filter_users_by_name(self, users: list[dict], filter_text: str) -> list[dict]:
-        """Filter users by name (user ID or display name)."""
-        if not filter_text:
-            return users
-
-        filter_text = filter_text.lower()
-        filtered_users = []
-
-        for user in users:
-            user_id = user.get("name", "").lower()
-            display_name = user.get("displayname", "").lower()
-
-            if filter_text in user_id or filter_text in display_name:
-                filtered_users.append(user)
-
-        return filtered_users
-
-    def sort_users(self, users: list[dict], sort_option: str) -> list[dict]:
-        """Sort users based on the specified option."""
-        if sort_option == "name_asc":
-            return sorted(users, key=lambda u: u.get("name", "").lower())
-        if sort_option == "name_desc":
-            return sorted(users, key=lambda u: u.get("name", "").lower(), reverse=True)
-        if sort_option == "display_asc":
-            return sorted(users, key=lambda u: u.get("displayname", "").lower())
-        if sort_option == "display_desc":
-            return sorted(
-                users,
-                key=lambda u: u.get("displayname", "").lower(),
-                reverse=True,
-            )
-        if sort_option == "role":
-            # Sort by role: admins first, then regular users, then deactivated
-            def role_sort_key(user):
-                is_admin = user.get("admin", False)
-                is_deactivated = user.get("deactivated", False)
-
-                if is_deactivated:
-                    return (2, user.get("name", "").lower())  # Deactivated last
-                if is_admin:
-                    return (0, user.get("name", "").lower())  # Admins first
-                return (1, user.get("name", "").lower())  # Regular users middle
+    def fetch_all_users(self) -> list[dict]:
+        """Fetch every active user on the server, following pagination."""
+        return list(self.iter_users())
 
-            return sorted(users, key=role_sort_key)
-        return users
+    def get_user(self, user_id: str) -> dict | None:
+        """Fetch one user's account details, or None if the user does not exist."""
+        try:
+            return self.client.make_request(
+                "GET",
+                f"/_synapse/admin/v2/users/{urllib.parse.quote(user_id, safe='')}",
+            )
+        except MatrixAPIError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def get_user_index(self, users: list[dict]) -> UserIndex:
+        """Return the column index for ``users``, rebuilding it after a refetch."""
+        index = self._user_index
+        if index is None or index.users is not users:
+            index = self._user_index = UserIndex(users)
+        return index
+
+    @staticmethod
+    def filter_user_indices(index: UserIndex, filter_text: str) -> Sequence[int]:
+        """Return positions of users whose ID or display name match the filter."""
+        if not filter_text:
+            return range(len(index))
+
+        return index.search(filter_text.lower())
+
+    @staticmethod
+    def sort_user_indices(
+        index: UserIndex,
+        indices: Sequence[int],
+        sort_option: str,
+    ) -> list[int]:
+        """Order ``indices`` by one of the precomputed index columns.
+
+        Sorting every user (no filter) reuses the index's cached ordering.
+        """
+        field, _, direction = sort_option.partition("_")
+        column = index.sort_columns.get(field)
+        if column is None:
+            return list(indices)
+        reverse = direction == "desc"
+        if len(indices) == len(index):
+            return index.order(field, reverse)
+        return sorted(indices, key=column.__getitem__, reverse=reverse)
 
     def get_user_sort_option(self) -> str:
         """Interactive sort option selection."""
@@ -70,29 +227,66 @@ class UserManager:
         print("  5. Role (Admin → User → Deactivated)")
         print("  0. No sorting")
 
-        while True:
-            try:
-                choice = input("Select sort option (0-5): ").strip()
-                sort_options = {
-                    "0": "none",
-                    "1": "name_asc",
-                    "2": "name_desc",
-                    "3": "display_asc",
-                    "4": "display_desc",
-                    "5": "role",
-                }
-
-                if choice in sort_options:
-                    return sort_options[choice]
-                print("Invalid option. Please choose 0-5.")
-            except KeyboardInterrupt:
-                return "none"
+        return FilterSortUI.prompt_option(
+            "Select sort option (0-5): ",
+            _SORT_OPTIONS,
+            "Invalid option. Please choose 0-5.",
+            "none",
+        )
+
+    def format_user_page(
+        self,
+        title: str,
+        index: UserIndex,
+        paginator: TerminalPaginator,
+        current_filter: str,
+        current_sort: str,
+        total_users: int,
+    ) -> list[str]:
+        """Lines of a user list screen up to the users on the current page.
+
+        ``paginator`` pages over positions into ``index.users``, so only the
+        users on the current page are looked up. The caller appends its own
+        options and draws the whole frame at once.
+        """
+        lines = self.screen_manager.header_lines(title)
+        lines.extend(
+            FilterSortUI.format_filter_sort_status(
+                current_filter,
+                "",
+                current_sort,
+                total_users,
+                len(paginator.items),
+                "users",
+            ),
+        )
+        if paginator.needs_pagination():
+            lines.append(
+                f"Page {paginator.current_page + 1} of {paginator.total_pages}",
+            )
+        lines.append("")
+
+        if paginator.items:
+            lines.extend(
+                index.format_page(
+                    (
+                        current_filter,
+                        current_sort,
+                        paginator.current_page,
+                        paginator.items_per_page,
+                    ),
+                    paginator.get_current_page_items(),
+                    paginator.get_current_page_start_index(),
+                ),
+            )
+        else:
+            lines.append("No users match the current filter.")
+        return lines
 
     def list_users(self) -> None:
         """Enhanced list all users with filtering and sorting."""
         try:
-            response = self.client.make_request("GET", "/_synapse/admin/v2/users")
-            all_users = response.get("users", [])
+            all_users = self.fetch_all_users()
 
             if not all_users:
                 self.screen_manager.show_header("Server Users")
@@ -103,91 +297,66 @@ class UserManager:
             # State variables for filtering and sorting
             current_filter = ""
             current_sort = "none"
-            filtered_users = all_users.copy()
+            index = self.get_user_index(all_users)
+            view_state = None
+            paginator = TerminalPaginator((), self.screen_manager)
 
             while True:
-                # Apply current filter and sort
-                if current_filter:
-                    filtered_users = self.filter_users_by_name(
-                        all_users,
-                        current_filter,
-                    )
-                else:
-                    filtered_users = all_users.copy()
-
-                if current_sort != "none":
-                    filtered_users = self.sort_users(filtered_users, current_sort)
+                # Apply current filter and sort on the precomputed index. Only
+                # redo them (and reset the page) when either one changed.
+                if view_state != (current_filter, current_sort):
+                    view_state = (current_filter, current_sort)
+                    indices = self.filter_user_indices(index, current_filter)
+                    if current_sort != "none":
+                        indices = self.sort_user_indices(index, indices, current_sort)
 
-                # Handle pagination
-                paginator = TerminalPaginator(filtered_users, self.screen_manager)
+                    # Paginate over positions; users are looked up per page
+                    paginator.set_items(indices)
 
                 # Display users
                 while True:
-                    self.screen_manager.show_header("Server Users")
-
-                    # Show filter/sort status
-                    FilterSortUI.show_filter_sort_status(
+                    frame = self.format_user_page(
+                        "Server Users",
+                        index,
+                        paginator,
                         current_filter,
-                        "",
                         current_sort,
                         len(all_users),
-                        len(filtered_users),
-                        "users",
                     )
 
-                    if paginator.needs_pagination():
-                        print(
-                            f"Page {paginator.current_page + 1} of {paginator.total_pages}",
-                        )
-
-                    print()
-
-                    # Show users
-                    if filtered_users:
-                        current_users = paginator.get_current_page_items()
-                        start_index = (
-                            paginator.current_page * paginator.items_per_page + 1
-                        )
-
-                        for i, user in enumerate(current_users):
-                            print(
-                                DataFormatter.format_user_info_enhanced(
-                                    user,
-                                    start_index + i,
-                                ),
-                            )
-                    else:
-                        print("No users match the current filter.")
-
                     # Show navigation options
-                    FilterSortUI.show_navigation_options(
-                        paginator.needs_pagination(),
-                        bool(filtered_users),
+                    frame.extend(
+                        FilterSortUI.format_navigation_options(
+                            paginator.needs_pagination(),
+                            bool(indices),
+                        ),
                     )
+                    self.screen_manager.draw_frame(frame)
 
                     choice = FilterSortUI.get_navigation_choice()
+                    command = FilterSortUI.list_command(choice)
 
-                    if choice.lower() == "q" or choice.lower() == "quit":
+                    if command == "quit":
                         return
-                    if choice.lower() == "f" or choice.lower() == "filter":
+                    if command == "filter":
                         new_filter = input(
                             "Enter name filter (partial match): ",
                         ).strip()
                         current_filter = new_filter
                         break  # Refresh display
-                    if choice.lower() == "s" or choice.lower() == "sort":
+                    if command == "sort":
                         current_sort = self.get_user_sort_option()
                         break  # Refresh display
-                    if choice.lower() == "c" or choice.lower() == "clear":
+                    if command == "clear":
                         current_filter = ""
                         break  # Refresh display
-                    if choice.lower() == "r" or choice.lower() == "reset":
+                    if command == "reset":
                         current_filter = ""
                         current_sort = "none"
                         break  # Refresh display
                     if FilterSortUI.handle_pagination_navigation(choice, paginator):
                         continue  # Page changed, refresh display
-                    if choice == "" and not filtered_users:
+                    if choice == "" and not indices:
                         return  # Exit if no users and Enter pressed
                     print("Invalid option." if choice else "")
 
@@ -256,8 +425,7 @@ class UserManager:
     def select_users_for_deactivation(self) -> list[dict]:
         """Show user list and allow user to select users for deactivation."""
         try:
-            response = self.client.make_request("GET", "/_synapse/admin/v2/users")
-            all_users = response.get("users", [])
+            all_users = self.fetch_all_users()
 
             # Filter out already deactivated users
             active_users = [
@@ -273,94 +441,72 @@ class UserManager:
             # State variables for filtering and sorting
             current_filter = ""
             current_sort = "none"
-            filtered_users = active_users.copy()
+            index = self.get_user_index(active_users)
+            view_state = None
+            paginator = TerminalPaginator((), self.screen_manager)
 
             while True:
-                # Apply current filter and sort
-                if current_filter:
-                    filtered_users = self.filter_users_by_name(
-                        active_users,
-                        current_filter,
-                    )
-                else:
-                    filtered_users = active_users.copy()
-
-                if current_sort != "none":
-                    filtered_users = self.sort_users(filtered_users, current_sort)
+                # Apply current filter and sort on the precomputed index. Only
+                # redo them (and reset the page) when either one changed.
+                if view_state != (current_filter, current_sort):
+                    view_state = (current_filter, current_sort)
+                    indices = self.filter_user_indices(index, current_filter)
+                    if current_sort != "none":
+                        indices = self.sort_user_indices(index, indices, current_sort)
 
-                # Handle pagination
-                paginator = TerminalPaginator(filtered_users, self.screen_manager)
+                    # Paginate over positions; users are looked up per page
+                    paginator.set_items(indices)
 
                 # Display users
                 while True:
-                    self.screen_manager.show_header(
+                    frame = self.format_user_page(
                         "Deactivate Users - Select from List",
-                    )
-
-                    # Show filter/sort status
-                    FilterSortUI.show_filter_sort_status(
+                        index,
+                        paginator,
                         current_filter,
-                        "",
                         current_sort,
                         len(active_users),
-                        len(filtered_users),
-                        "users",
                     )
 
-                    if paginator.needs_pagination():
-                        print(
-                            f"Page {paginator.current_page + 1} of {paginator.total_pages}",
-                        )
-
-                    print()
-
-                    # Show users
-                    if filtered_users:
-                        current_users = paginator.get_current_page_items()
-                        start_index = paginator.get_current_page_start_index()
-
-                        for i, user in enumerate(current_users):
-                            global_index = start_index + i
-                            print(
-                                DataFormatter.format_user_info_enhanced(
-                                    user,
-                                    global_index,
-                                ),
-                            )
-                    else:
-                        print("No users match the current filter.")
-
                     # Show selection instructions
-                    if filtered_users:
-                        print("\nSelection:")
+                    if indices:
                         examples = SelectionParser.format_selection_examples(
-                            len(filtered_users),
+                            len(indices),
+                        )
+                        frame.extend(
+                            (
+                                "\nSelection:",
+                                f"  Enter numbers to deactivate: {examples}",
+                                "  Or use navigation/filter options below",
+                            ),
                         )
-                        print(f"  Enter numbers to deactivate: {examples}")
-                        print("  Or use navigation/filter options below")
 
-                    FilterSortUI.show_navigation_options(
-                        paginator.needs_pagination(),
-                        bool(filtered_users),
+                    frame.extend(
+                        FilterSortUI.format_navigation_options(
+                            paginator.needs_pagination(),
+                            bool(indices),
+                        ),
                     )
+                    self.screen_manager.draw_frame(frame)
 
                     choice = FilterSortUI.get_navigation_choice()
+                    command = FilterSortUI.list_command(choice)
 
-                    if choice.lower() == "q" or choice.lower() == "quit":
+                    if command == "quit":
                         return []
-                    if choice.lower() == "f" or choice.lower() == "filter":
+                    if command == "filter":
                         new_filter = input(
                             "Enter name filter (partial match): ",
                         ).strip()
                         current_filter = new_filter
                         break  # Refresh display
-                    if choice.lower() == "s" or choice.lower() == "sort":
+                    if command == "sort":
                         current_sort = self.get_user_sort_option()
                         break  # Refresh display
-                    if choice.lower() == "c" or choice.lower() == "clear":
+                    if command == "clear":
                         current_filter = ""
                         break  # Refresh display
-                    if choice.lower() == "r" or choice.lower() == "reset":
+                    if command == "reset":
                         current_filter = ""
                         current_sort = "none"
                         break  # Refresh display
@@ -368,13 +514,13 @@ class UserManager:
                         continue  # Page changed, refresh display
                     # Try to parse as selection
                     try:
-                        if not filtered_users:
+                        if not indices:
                             print("No users available for selection.")
                             continue
 
                         selected_indices = SelectionParser.parse_selection(
                             choice,
-                            len(filtered_users),
+                            len(indices),
                         )
                         if not selected_indices:
                             print("No valid selection made.")
@@ -384,7 +530,7 @@ class UserManager:
                         selected_users = []
                         for idx in selected_indices:
                             selected_users.append(
-                                filtered_users[idx - 1],
+                                active_users[indices[idx - 1]],
                             )  # Convert to 0-based
 
                         return selected_users
@@ -430,14 +576,7 @@ class UserManager:
 
             # Find the user object for consistency with batch deactivation
             try:
-                response = self.client.make_request("GET", "/_synapse/admin/v2/users")
-                all_users = response.get("users", [])
-
-                selected_user = None
-                for user in all_users:
-                    if user["name"] == user_id:
-                        selected_user = user
-                        break
+                selected_user = self.get_user(user_id)
 
                 if selected_user:
                     if selected_user.get("deactivated", False):
@@ -458,23 +597,27 @@ class UserManager:
 
     def deactivate_selected_users(self, selected_users: list[dict]) -> None:
         """Deactivate the selected users after confirmation."""
-        self.screen_manager.show_header("Confirm User Deactivation")
-
-        print(f"You have selected {len(selected_users)} user(s) for deactivation:")
-        print()
+        with self.screen_manager.frame("Confirm User Deactivation") as out:
+            print(
+                f"You have selected {len(selected_users)} user(s) for deactivation:",
+                file=out,
+            )
+            print(file=out)
+
+            for i, user in enumerate(selected_users, 1):
+                user_id = user["name"]
+                display_name = user.get("displayname", "No display name")
+                role_tag = DataFormatter.get_user_role_tag(user)
+                print(f"{i}. {role_tag} {user_id}", file=out)
+                print(f"   Display: {display_name}", file=out)
+                print(file=out)
+
+            print("⚠️  WARNING: This action cannot be undone!", file=out)
+            print(
+                "Deactivated users will lose access to the server and their sessions will be terminated.",
+                file=out,
+            )
 
-        for i, user in enumerate(selected_users, 1):
-            user_id = user["name"]
-            display_name = user.get("displayname", "No display name")
-            role_tag = DataFormatter.get_user_role_tag(user)
-            print(f"{i}. {role_tag} {user_id}")
-            print(f"   Display: {display_name}")
-            print()
-
-        print("⚠️  WARNING: This action cannot be undone!")
-        print(
-            "Deactivated users will lose access to the server and their sessions will be terminated.",
-        )
         confirm = (
             input("Are you sure you want to deactivate these users? (yes/no): ")
             .strip()
@@ -490,7 +633,15 @@ class UserManager:
         successful_deactivations = []
         failed_deactivations = []
 
-        for i, user in enumerate(selected_users, 1):
+        # Deactivations are independent, so send them concurrently and report
+        # in selection order
+        deactivate_data = {"deactivated": True}
+        responses = self.client.request_many(
+            ("PUT", f"/_synapse/admin/v2/users/{user['name']}", deactivate_data)
+            for user in selected_users
+        )
+
+        for i, (user, response) in enumerate(zip(selected_users, responses), 1):
             user_id = user["name"]
             display_name = user.get("displayname", "No display name")
 
@@ -500,25 +651,15 @@ class UserManager:
                 f"{display_name} ({user_id})",
             )
 
-            try:
-                deactivate_data = {"deactivated": True}
-
-                response = self.client.make_request(
-                    "PUT",
-                    f"/_synapse/admin/v2/users/{user_id}",
-                    deactivate_data,
-                )
-
-                if response:
-                    print("✓ User deactivated successfully")
-                    successful_deactivations.append(user)
-                else:
-                    print("✗ Failed to deactivate user")
-                    failed_deactivations.append((user, "Unexpected response"))
-
-            except Exception as e:
-                print(f"✗ Error: {e}")
-                failed_deactivations.append((user, str(e)))
+            if isinstance(response, Exception):
+                print(f"✗ Error: {response}")
+                failed_deactivations.append((user, str(response)))
+            elif response:
+                print("✓ User deactivated successfully")
+                successful_deactivations.append(user)
+            else:
+                print("✗ Failed to deactivate user")
+                failed_deactivations.append((user, "Unexpected response"))
 
         # Show summary
         ProgressMonitor.show_operation_summary(
@@ -2,6 +2,23 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
+
+# A complete selection: comma-separated numbers and "start-end" ranges.
+_SELECTION_RE = re.compile(r"\s*\d+\s*(?:-\s*\d+\s*)?(?:,\s*\d+\s*(?:-\s*\d+\s*)?)*")
+# A single number or range inside a selection matched by _SELECTION_RE.
+_SELECTION_ITEM_RE = re.compile(r"(\d+)\s*(?:-\s*(\d+))?")
+
+# Room entry layouts, filled with the % operator once per displayed room.
+_ROOM_INFO_TEMPLATE = "%3d. Room: %s\n     ID: %s\n     Alias: %s\n     Members: %s\n"
+_ROOM_ENTRY_TEMPLATE = "%s %s\n     ID: %s\n     Alias: %s\n"
+_MEMBER_INDICATORS = {0: "👤 Empty", 1: "👤 1 member"}
+_MEMBERS_INDICATOR_TEMPLATE = "👥 %s members"
+# User entry layout, filled with the % operator once per displayed user.
+_USER_ENTRY_TEMPLATE = "%s %s\n     Display: %s\n"
+
 
 class SelectionParser:
     """Parse user selection input like '1', '1-5', '1,3,5', etc."""
@@ -16,47 +33,48 @@ class SelectionParser:
         - Comma-separated: "1,3,5"
         - Mixed: "1,3-5,7"
         """
-        if not selection_str.strip():
+        selection_str = selection_str.strip()
+        if not selection_str:
             return []
 
+        # A lone number or range (the common case) needs no dedup or sort.
+        match = _SELECTION_ITEM_RE.fullmatch(selection_str)
+        if match is not None:
+            return list(SelectionParser._selection_item_range(match, max_items))
+
+        if not _SELECTION_RE.fullmatch(selection_str):
+            msg = f"Invalid selection format: '{selection_str}'"
+            raise ValueError(msg)
+
         indices = set()
-        parts = [part.strip() for part in selection_str.split(",")]
-
-        for part in parts:
-            if "-" in part:
-                # Handle range
-                try:
-                    start, end = part.split("-", 1)
-                    start_idx = int(start.strip())
-                    end_idx = int(end.strip())
-
-                    if start_idx < 1 or end_idx > max_items or start_idx > end_idx:
-                        msg = f"Invalid range: {part}"
-                        raise ValueError(msg)
-
-                    for i in range(start_idx, end_idx + 1):
-                        indices.add(i)
-
-                except ValueError as e:
-                    msg = f"Invalid range format '{part}': {e}"
-                    raise ValueError(msg)
-            else:
-                # Handle single number
-                try:
-                    idx = int(part.strip())
-                    if idx < 1 or idx > max_items:
-                        msg = f"Number {idx} is out of range (1-{max_items})"
-                        raise ValueError(msg)
-                    indices.add(idx)
-                except ValueError:
-                    msg = f"Invalid number: {part}"
-                    raise ValueError(msg)
+        for match in _SELECTION_ITEM_RE.finditer(selection_str):
+            indices.update(SelectionParser._selection_item_range(match, max_items))
 
         return sorted(indices)
 
     @staticmethod
+    def _selection_item_range(match: re.Match, max_items: int) -> range:
+        """Validate one number or range from a selection and return its indices."""
+        start_idx = int(match.group(1))
+        if match.group(2) is None:
+            if start_idx < 1 or start_idx > max_items:
+                msg = f"Number {start_idx} is out of range (1-{max_items})"
+                raise ValueError(msg)
+            return range(start_idx, start_idx + 1)
+
+        end_idx = int(match.group(2))
+        if start_idx < 1 or end_idx > max_items or start_idx > end_idx:
+            msg = f"Invalid range: {match.group(0)}"
+            raise ValueError(msg)
+        return range(start_idx, end_idx + 1)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
     def format_selection_examples(max_items: int) -> str:
-        """Generate example selection strings based on available items."""
+        """Generate example selection strings based on available items.
+
+        Cached per item count, since list screens ask again on every redraw.
+        """
         examples = []
 
         if max_items >= 1:
@@ -81,35 +99,26 @@ class DataFormatter:
         name = room.get("name", "Unnamed room")
         members = room.get("joined_members", 0)
 
-        return (
-            f"{index:3d}. Room: {name}\n"
-            f"     ID: {room['room_id']}\n"
-            f"     Alias: {alias}\n"
-            f"     Members: {members}\n"
-        )
+        return _ROOM_INFO_TEMPLATE % (index, name, room["room_id"], alias, members)
 
     @staticmethod
     def format_room_info_enhanced(room: dict, index: int) -> str:
         """Enhanced format room information for display with member count highlight."""
+        return f"{index:3d}. {DataFormatter.format_room_entry(room)}"
+
+    @staticmethod
+    def format_room_entry(room: dict) -> str:
+        """``format_room_info_enhanced`` output without the leading number."""
         alias = room.get("canonical_alias", "No alias")
         name = room.get("name", "Unnamed room")
         members = room.get("joined_members", 0)
 
         # Add member count indicator
-        if members == 0:
-            member_indicator = "👤 Empty"
-        elif members == 1:
-            member_indicator = "👤 1 member"
-        elif members < 10:
-            member_indicator = f"👥 {members} members"
-        else:
-            member_indicator = f"👥 {members} members"
+        member_indicator = _MEMBER_INDICATORS.get(members)
+        if member_indicator is None:
+            member_indicator = _MEMBERS_INDICATOR_TEMPLATE % members
 
-        return (
-            f"{index:3d}. {member_indicator} {name}\n"
-            f"     ID: {room['room_id']}\n"
-            f"     Alias: {alias}\n"
-        )
+        return _ROOM_ENTRY_TEMPLATE % (member_indicator, name, room["room_id"], alias)
 
     @staticmethod
     def format_user_info(user: dict, index: int) -> str:
@@ -132,11 +141,16 @@ class DataFormatter:
     @staticmethod
     def format_user_info_enhanced(user: dict, index: int) -> str:
         """Enhanced format user information for display with role tags."""
+        return f"{index:3d}. {DataFormatter.format_user_entry(user)}"
+
+    @staticmethod
+    def format_user_entry(user: dict) -> str:
+        """``format_user_info_enhanced`` output without the leading number."""
         user_id = user["name"]
         display_name = user.get("displayname", "No display name")
         role_tag = DataFormatter.get_user_role_tag(user)
 
-        return f"{index:3d}. {role_tag} {user_id}\n     Display: {display_name}\n"
+        return _USER_ENTRY_TEMPLATE % (role_tag, user_id, display_name)
 
     @staticmethod
     def get_user_role_tag(user: dict) -> str: